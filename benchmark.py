@@ -0,0 +1,242 @@
+# Benchmarks for the rating and averaging hot paths of the netology_oop package
+#
+# Usage:
+#   python benchmark.py --scales 1000,100000 --output bench.json
+#   python benchmark.py --scales 1000 --compare bench.json
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import netology_oop
+
+
+def make_population(students: int, courses: int = 10, grades_per_course: int = 5,
+                    seed: int = 335) -> dict:
+    """
+    Build a synthetic cohort of students, lecturers and reviewers.
+
+    Every student attends two courses, receives grades_per_course grades in each of them
+    and rates one lecturer of each course. There is one lecturer and one reviewer per
+    hundred students, at least one per course.
+
+    Args:
+        students (int): The number of students.
+        courses (int): The number of distinct courses.
+        grades_per_course (int): The number of lesson grades per student and course.
+        seed (int): The random seed.
+
+    Returns:
+        dict: The people and the rating calls that built their grades.
+    """
+    rng: random.Random = random.Random(seed)
+    course_names: list[str] = [f'Course {number}' for number in range(courses)]
+    mentors: int = max(courses, students // 100)
+
+    lecturers: list = []
+    reviewers: list = []
+    for number in range(mentors):
+        lecturer = netology_oop.Lecturer('Лектор', str(number), 'Мужчина')
+        reviewer = netology_oop.Reviewer('Проверяющий', str(number), 'Женщина')
+        lecturer.courses_attached += [course_names[number % courses]]
+        reviewer.courses_attached += [course_names[number % courses]]
+        lecturers.append(lecturer)
+        reviewers.append(reviewer)
+
+    cohort: list = []
+    student_ratings: list[tuple] = []
+    lecturer_ratings: list[tuple] = []
+    for number in range(students):
+        student = netology_oop.Student('Студент', str(number), 'Женщина')
+        first: int = rng.randrange(courses)
+        attended: list[int] = [first, (first + 1) % courses]
+        student.courses_in_progress += [course_names[course] for course in attended]
+        cohort.append(student)
+        for course in attended:
+            # Mentor number m teaches course m % courses
+            mentor: int = course + courses * rng.randrange(mentors // courses)
+            grades: list[int] = [rng.randint(1, 10) for _ in range(grades_per_course)]
+            student_ratings.append((reviewers[mentor], student, course_names[course], grades))
+            lecturer_ratings.append((student, lecturers[mentor], course_names[course],
+                                     rng.randint(1, 10)))
+
+    return {'students': cohort, 'lecturers': lecturers, 'reviewers': reviewers,
+            'courses': course_names, 'student_ratings': student_ratings,
+            'lecturer_ratings': lecturer_ratings}
+
+
+def timed(function, repeat: int = 3) -> float:
+    """
+    Return the best wall-clock time of several runs of a function, in seconds.
+    """
+    best: float = float('inf')
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def population_memory(students: int) -> dict:
+    """
+    Measure the memory allocated by building and rating a population.
+    """
+    tracemalloc.start()
+    try:
+        population: dict = make_population(students)
+        built: int = tracemalloc.get_traced_memory()[0]
+        for reviewer, student, course, grades in population['student_ratings']:
+            reviewer.rate_student(student, course, grades)
+        rated: int = tracemalloc.get_traced_memory()[0]
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'bytes_per_student': round(built / students, 1),
+            'grade_bytes_per_student': round((rated - built) / students, 1),
+            'peak_bytes': peak}
+
+
+def run_scale(students: int, repeat: int) -> dict:
+    """
+    Run every timed case on a population of the given size.
+
+    Returns:
+        dict: Seconds and nanoseconds per operation for every case.
+    """
+    population: dict = make_population(students)
+    cohort: list = population['students']
+    lecturers: list = population['lecturers']
+    course: str = population['courses'][0]
+    student_grades: list = [student.grades for student in cohort]
+    lecturer_grades: list = [lecturer.grades for lecturer in lecturers]
+    results: dict = {}
+
+    def record(name: str, seconds: float, operations: int) -> None:
+        results[name] = {'seconds': round(seconds, 6),
+                         'ns_per_op': round(seconds / operations * 1e9, 1)}
+
+    def rate_students() -> None:
+        for reviewer, student, rated_course, grades in population['student_ratings']:
+            reviewer.rate_student(student, rated_course, grades)
+
+    def rate_lecturers() -> None:
+        for student, lecturer, rated_course, grade in population['lecturer_ratings']:
+            student.rate_lecturer(lecturer, rated_course, grade)
+
+    # Writes are not repeated: every run would add more grades
+    record('rate_student', timed(rate_students, 1), len(population['student_ratings']))
+    record('rate_lecturer', timed(rate_lecturers, 1), len(population['lecturer_ratings']))
+    record('average_lists', timed(lambda: [student.average(list(student.grades.values()))
+                                           for student in cohort], repeat), len(cohort))
+    record('average_value', timed(lambda: [student.average_value for student in cohort],
+                                  repeat), len(cohort))
+    record('count_unique_keys', timed(lambda: netology_oop.count_unique_keys(student_grades),
+                                      repeat), len(cohort))
+    record('average_rating_students', timed(
+        lambda: netology_oop.average_rating(course, student_grades), repeat), len(cohort))
+    record('average_rating_lecturers', timed(
+        lambda: netology_oop.average_rating(course, lecturer_grades), repeat), len(lecturers))
+    record('course_index_lookup',
+           timed(lambda: netology_oop.course_index.average(course), repeat), 1)
+
+    def render_cold() -> None:
+        for student in cohort:
+            student.invalidate_render()
+            str(student)
+
+    record('str_cold', timed(render_cold, repeat), len(cohort))
+    record('str_cached', timed(lambda: [str(student) for student in cohort], repeat),
+           len(cohort))
+    record('compare_pairs', timed(lambda: [first > second for first, second
+                                           in zip(cohort, cohort[1:])], repeat), len(cohort))
+    record('sorted', timed(lambda: sorted(cohort), repeat), len(cohort))
+    record('top_k_10', timed(lambda: netology_oop.top_k(cohort, 10), repeat), len(cohort))
+
+    return results
+
+
+def import_time(module: str = 'netology_oop', repeat: int = 5) -> dict:
+    """
+    Measure how long a fresh interpreter takes to import a module.
+
+    The cost of starting an empty interpreter is measured the same way and subtracted. The
+    interpreters run in the directory of this script, so the package is found however the
+    benchmark was started.
+
+    Returns:
+        dict: The best import time and the modules it pulled in, in milliseconds.
+    """
+    root: str = os.path.dirname(os.path.abspath(__file__))
+
+    def best_run(code: str) -> float:
+        best: float = float('inf')
+        for _ in range(repeat):
+            started: float = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True, cwd=root)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    seconds: float = best_run(f'import {module}') - best_run('pass')
+    loaded: str = subprocess.run(
+        [sys.executable, '-c', f'import sys; before = set(sys.modules); import {module}; '
+                               f'print(len(set(sys.modules) - before))'],
+        check=True, capture_output=True, text=True, cwd=root).stdout
+    return {'ms': round(max(seconds, 0) * 1000, 2), 'modules_loaded': int(loaded)}
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """
+    Format the per-operation ratio current / baseline of every case present in both reports.
+    """
+    lines: list[str] = []
+    if 'import' in baseline:
+        lines.append(f'{"import":>9} {"netology_oop":<26} {baseline["import"]["ms"]:>12} -> '
+                     f'{current["import"]["ms"]:>12} ms')
+    for scale, cases in current['scales'].items():
+        for name, case in cases.items():
+            old: dict = baseline['scales'].get(scale, {}).get(name)
+            if name == 'memory' or not old:
+                continue
+            ratio: float = (case['ns_per_op'] / old['ns_per_op'] if old['ns_per_op']
+                            else float('inf'))
+            lines.append(f'{scale:>9} {name:<26} {old["ns_per_op"]:>12} -> '
+                         f'{case["ns_per_op"]:>12} ns/op  x{ratio:.2f}')
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the rating and averaging code.')
+    parser.add_argument('--scales', default='1000,100000',
+                        help='comma separated student counts, e.g. 1000,100000,1000000')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per read-only case')
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--compare', help='a previous JSON report to compare against')
+    args = parser.parse_args(argv)
+
+    report: dict = {'python': platform.python_version(),
+                    'numpy': importlib.util.find_spec('numpy') is not None,
+                    'import': import_time(), 'scales': {}}
+    for scale in (int(value) for value in args.scales.split(',')):
+        results: dict = run_scale(scale, args.repeat)
+        results['memory'] = population_memory(scale)
+        report['scales'][str(scale)] = results
+
+    text: str = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            print(compare(json.load(file), report))
+    elif not args.output:
+        print(text)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,70 @@
+# Students, mentors and grade statistics from the OOP homework, as an importable library.
+#
+# Importing the package only loads the model and the course statistics. The heavier
+# subsystems (columnar and on-disk storage, distributions, time windows, the rating journal,
+# the registry, comparison matrices, weights, ingestion, reports, the async service, the process
+# pool) are imported on first attribute access. The demo lives in netology_oop.demo and runs
+# with ``python -m netology_oop``.
+import importlib
+
+from netology_oop.model import (COURSE_COMPLETED, COURSE_NOT_ATTACHED, COURSE_NOT_IN_PROGRESS,
+                                WRONG_TYPE, CourseRecord, CourseSet, GradeAggregate, GradeBook,
+                                GradeList, GradeWrite, Lecturer, MathMethods, Mentor,
+                                PersonalInfo, RatingError, RatingListener, Reviewer, ShardedLocks,
+                                Student, disable_concurrent_rating, disable_grade_history,
+                                disable_grade_storage, enable_concurrent_rating,
+                                enable_grade_history, enable_grade_storage, enrollment_listeners,
+                                grade_runs, rate_in_bulk, rate_rows, rating_listeners,
+                                rename_listeners)
+from netology_oop.metrics import Metrics, disable_metrics, enable_metrics
+from netology_oop.stats import (CourseIndex, Leaderboard, average_rating, count_unique_keys,
+                                course_index, top_k)
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_NAMES: dict[str, str] = {
+    'ColumnarGrades': 'columnar',
+    'ColumnarGradeStore': 'columnar',
+    'ColumnarGradeView': 'columnar',
+    'GradeIngestor': 'ingest',
+    'IngestReport': 'ingest',
+    'chunked': 'ingest',
+    'read_grade_rows': 'ingest',
+    'MappedGradeStore': 'storage',
+    'save_model': 'storage',
+    'write_report': 'report',
+    'AsyncRatingService': 'service',
+    'parallel_average_rating': 'parallel',
+    'parallel_course_totals': 'parallel',
+    'GradeDistribution': 'distribution',
+    'GradeHistogram': 'distribution',
+    'RollingWindow': 'windows',
+    'TumblingWindows': 'windows',
+    'WindowedGrades': 'windows',
+    'JournalEntry': 'journal',
+    'RatingJournal': 'journal',
+    'Registry': 'registry',
+    'ComparisonMatrix': 'comparison',
+    'GradeWeights': 'weights',
+    'bytes_per_instance': 'diagnostics',
+    'concurrent_rating_stress_test': 'diagnostics',
+}
+
+__all__ = [
+    'COURSE_COMPLETED', 'COURSE_NOT_ATTACHED', 'COURSE_NOT_IN_PROGRESS', 'WRONG_TYPE',
+    'CourseIndex', 'CourseRecord', 'CourseSet', 'GradeAggregate', 'GradeBook', 'GradeList',
+    'GradeWrite', 'Leaderboard', 'Lecturer', 'MathMethods', 'Mentor', 'Metrics', 'PersonalInfo',
+    'RatingError', 'RatingListener', 'Reviewer', 'ShardedLocks', 'Student', 'average_rating',
+    'count_unique_keys', 'course_index', 'disable_concurrent_rating', 'disable_grade_history',
+    'disable_grade_storage', 'disable_metrics', 'enable_concurrent_rating',
+    'enable_grade_history', 'enable_grade_storage', 'enable_metrics', 'enrollment_listeners',
+    'grade_runs', 'rate_in_bulk', 'rate_rows', 'rating_listeners', 'rename_listeners', 'top_k',
+    *_LAZY_NAMES,
+]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{_LAZY_NAMES[name]}'), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,3 @@
+from netology_oop.demo import main
+
+main()
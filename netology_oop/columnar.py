@@ -0,0 +1,410 @@
+# A columnar grade store: typed grade arrays per person and course, scanned as columns
+import threading
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+
+from netology_oop.model import GradeAggregate, RatingListener, Student
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the columnar store falls back to pure Python
+    np = None
+
+# Grade column types from the most compact to the widest; 'd' takes any other number
+GRADE_TYPECODES: tuple[str, ...] = ('b', 'h', 'i', 'q', 'd')
+
+
+def _grade_typecode(grade) -> str:
+    # The most compact grade column type that holds a grade exactly
+    if isinstance(grade, int):
+        for typecode in GRADE_TYPECODES[:-1]:
+            bound: int = 1 << (8 * array(typecode).itemsize - 1)
+            if -bound <= grade < bound:
+                return typecode
+    return 'd'
+
+
+def widen_grade_column(column: array, grades: list) -> array:
+    """
+    Return the grade column itself, or a copy in the most compact type that also holds grades.
+    """
+    rank: int = GRADE_TYPECODES.index(column.typecode)
+    needed: int = max((GRADE_TYPECODES.index(_grade_typecode(grade)) for grade in grades),
+                      default=0)
+    return array(GRADE_TYPECODES[needed], column) if needed > rank else column
+
+
+def _concatenate(columns: list[array]) -> array:
+    # One array of the grades of all columns, in the widest of their types
+    typecode: str = max((column.typecode for column in columns), key=GRADE_TYPECODES.index,
+                        default='b')
+    grades: array = array(typecode)
+    for column in columns:
+        grades.extend(column if column.typecode == typecode else array(typecode, column))
+    return grades
+
+
+# Columnar grade storage
+class ColumnarGradeStore(RatingListener):
+    """
+    Array-backed grade storage with vectorized statistics per course, person, cohort and role.
+
+    The grades of every person and course sit in a typed array: int8 until a grade does not
+    fit it, then int16, int32, int64 and float64, so no grade is ever refused halfway through
+    a rating. Together the arrays are the grade column of a table whose person and course
+    columns are run-length encoded; columns() lays the three out flat. Statistics over a
+    scope concatenate the matching arrays and are vectorized with NumPy when it is installed
+    and computed in pure Python otherwise.
+
+    The store is filled in one of two ways. As a rating listener it mirrors the grades the
+    GradeBook lists hold. Given to enable_grade_storage as ``store.grades_for``, it stands in
+    for those lists instead: every course a GradeBook starts from then on keeps its grades
+    here and the book holds a ColumnarGrades view of them, so a grade costs one byte rather
+    than a list slot. Grades the store already holds are not mirrored again.
+
+    Attributes:
+        people (list): The graded people, indexed by person id.
+        courses (list): The course names, indexed by course id.
+        version (int): Bumped on every change.
+    """
+
+    def __init__(self):
+        self.people: list = []
+        self.courses: list[str] = []
+        self._person_ids: dict[int, int] = {}
+        self._course_ids: dict[str, int] = {}
+        # The grade array of every course id of every person id
+        self._grades: dict[int, dict[int, array]] = {}
+        self.version: int = 0
+        # The flat columns and the version they were built at
+        self._columns: tuple | None = None
+        # The arrays are shared by every course, so course shard locks are not enough
+        self._lock: threading.Lock = threading.Lock()
+
+    def person_id(self, person) -> int:
+        """
+        Return the id of a person, assigning a new one on first use.
+        """
+        key: int = id(person)
+        if key not in self._person_ids:
+            self._person_ids[key] = len(self.people)
+            self.people.append(person)
+        return self._person_ids[key]
+
+    def course_id(self, course: str) -> int:
+        """
+        Return the id of a course, assigning a new one on first use.
+        """
+        if course not in self._course_ids:
+            self._course_ids[course] = len(self.courses)
+            self.courses.append(course)
+        return self._course_ids[course]
+
+    def grades_for(self, owner, course: str) -> 'ColumnarGrades':
+        """
+        Return an empty ColumnarGrades to keep the grades of a new course of a GradeBook in.
+
+        Parameters:
+            owner (Student | Lecturer): The person the GradeBook belongs to.
+            course (str): The course.
+
+        Returns:
+            ColumnarGrades: The view the GradeBook holds for the course.
+        """
+        with self._lock:
+            courses: dict[int, array] = self._grades.setdefault(self.person_id(owner), {})
+            course_id: int = self.course_id(course)
+            # Grades mirrored for a course the book no longer has are not the book's
+            courses[course_id] = array('b')
+            self.version += 1
+        return ColumnarGrades(self, courses, course_id)
+
+    def _holds(self, owner, course: str) -> bool:
+        # Whether the GradeBook of owner keeps the grades of course in this store
+        grades = getattr(owner, 'grades', None)
+        held = grades.get(course) if grades is not None else None
+        return isinstance(held, ColumnarGrades) and held._store is self
+
+    def _extend(self, courses: dict[int, array], course_id: int, grades: list) -> None:
+        with self._lock:
+            column: array | None = courses.get(course_id)
+            column = widen_grade_column(array('b') if column is None else column, grades)
+            column.extend(grades)
+            courses[course_id] = column
+            self.version += 1
+
+    def _delete(self, courses: dict[int, array], course_id: int, position: int) -> None:
+        with self._lock:
+            del courses[course_id][position]
+            self.version += 1
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        """
+        Mirror freshly written grades, unless the store already holds them.
+
+        Parameters:
+            owner (Student | Lecturer): The person who received the grades.
+            course (str): The course the grades belong to.
+            grades (list): The grades that were written.
+            timestamp (float): When the grades were given.
+        """
+        if self._holds(owner, course):
+            return
+        with self._lock:
+            courses: dict[int, array] = self._grades.setdefault(self.person_id(owner), {})
+            course_id: int = self.course_id(course)
+        self._extend(courses, course_id, grades)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Delete the most recent mirrored grades that were taken back.
+        """
+        if self._holds(owner, course):
+            return
+        with self._lock:
+            courses: dict[int, array] = self._grades.get(self._person_ids.get(id(owner)), {})
+            column: array | None = courses.get(self._course_ids.get(course))
+            if column is None:
+                return
+            pending: list = list(grades)
+            for row in range(len(column) - 1, -1, -1):
+                if not pending:
+                    break
+                if column[row] in pending:
+                    pending.remove(column[row])
+                    del column[row]
+            self.version += 1
+
+    def load(self, people: list) -> 'ColumnarGradeStore':
+        """
+        Mirror the existing grades of people.
+
+        Parameters:
+            people (list): Students or lecturers whose grades should be loaded.
+
+        Returns:
+            ColumnarGradeStore: The store itself.
+        """
+        for person in people:
+            for course, grades in person.grades.items():
+                self(person, course, grades, None)
+        return self
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(column) for courses in self._grades.values()
+                       for column in courses.values())
+
+    def columns(self) -> tuple[array, array, array]:
+        """
+        Return the grade, person id and course id of every grade as three flat columns.
+
+        The columns are built on first use and kept until the store changes.
+        """
+        with self._lock:
+            if self._columns is None or self._columns[0] != self.version:
+                runs: list[tuple[int, int, array]] = [
+                    (person_id, course_id, column)
+                    for person_id, courses in self._grades.items()
+                    for course_id, column in courses.items()]
+                person_column: array = array('i')
+                course_column: array = array('i')
+                for person_id, course_id, column in runs:
+                    person_column.extend(array('i', [person_id]) * len(column))
+                    course_column.extend(array('i', [course_id]) * len(column))
+                self._columns = (self.version, _concatenate([run[2] for run in runs]),
+                                 person_column, course_column)
+            return self._columns[1:]
+
+    def grades_view(self, person) -> 'ColumnarGradeView':
+        """
+        Return a read-only ``{course: [grades]}`` view of one person's grades.
+        """
+        return ColumnarGradeView(self, person)
+
+    def select(self, course: str = None, person=None, cohort: list = None, role: type = None):
+        """
+        Return the grades matching the given scope.
+
+        Parameters:
+            course (str): Only grades for this course.
+            person (Student | Lecturer): Only grades of this person.
+            cohort (list): Only grades of these people.
+            role (type): Only grades of this kind of person, such as Lecturer; defaults to
+            Student unless a person or cohort is given.
+
+        Returns:
+            numpy.ndarray | list: The selected grades.
+        """
+        if person is not None:
+            cohort = [person] if cohort is None else [p for p in cohort if p is person]
+        if cohort is None and role is None:
+            role = Student
+        with self._lock:
+            person_ids: Iterable = (range(len(self.people)) if cohort is None else
+                                    dict.fromkeys(self._person_ids[id(p)] for p in cohort
+                                                  if id(p) in self._person_ids))
+            course_id: int | None = (self._course_ids.get(course, -1) if course is not None
+                                     else None)
+            columns: list[array] = []
+            for person_id in person_ids:
+                if role is not None and not isinstance(self.people[person_id], role):
+                    continue
+                courses: dict[int, array] = self._grades.get(person_id, {})
+                if course_id is None:
+                    columns.extend(courses.values())
+                elif course_id in courses:
+                    columns.append(courses[course_id])
+            grades: array = _concatenate(columns)
+
+        if np is not None:
+            return np.frombuffer(grades, dtype=grades.typecode)
+        return grades.tolist()
+
+    def mean(self, **scope) -> float:
+        """
+        Return the mean grade of a scope rounded to one decimal place.
+        """
+        grades = self.select(**scope)
+        if not len(grades):
+            return 'Еще нет оценок'
+        if np is not None:
+            return round(float(grades.mean(dtype=np.float64)), 1)
+        return round(sum(grades) / len(grades), 1)
+
+    def percentile(self, q: float, **scope) -> float:
+        """
+        Return the q-th percentile (0-100) of a scope using linear interpolation.
+        """
+        grades = self.select(**scope)
+        if not len(grades):
+            return None
+        if np is not None:
+            return float(np.percentile(grades, q))
+        ordered: list = sorted(grades)
+        position: float = (len(ordered) - 1) * q / 100
+        lower: int = int(position)
+        upper: int = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    def median(self, **scope) -> float:
+        """
+        Return the median grade of a scope.
+        """
+        return self.percentile(50, **scope)
+
+    def histogram(self, **scope) -> dict[int, int]:
+        """
+        Return the number of occurrences of every grade in a scope.
+        """
+        grades = self.select(**scope)
+        if np is not None:
+            values, counts = np.unique(grades, return_counts=True)
+            return {int(value): int(count) for value, count in zip(values, counts)}
+        counts: dict = {}
+        for grade in grades:
+            counts[grade] = counts.get(grade, 0) + 1
+        return dict(sorted(counts.items()))
+
+
+class ColumnarGrades(Sequence):
+    """
+    The grades of one course in a GradeBook, kept in a typed array of a ColumnarGradeStore.
+
+    It stands in for a GradeList once the store is given to enable_grade_storage: it reads
+    like the list, compares equal to it and carries the same running statistics, which its
+    GradeBook keeps up to date as it changes the grades. Slices, copies and pickles are plain
+    lists.
+
+    Attributes:
+        total (int): The sum of the grades.
+        sum_squares (int): The sum of the squared grades.
+        minimum (int): The lowest grade, or None if there are no grades.
+        maximum (int): The highest grade, or None if there are no grades.
+    """
+
+    __slots__ = ('total', 'sum_squares', 'minimum', 'maximum', '_store', '_courses',
+                 '_course_id')
+
+    def __init__(self, store: ColumnarGradeStore, courses: dict[int, array], course_id: int):
+        self._store: ColumnarGradeStore = store
+        # The person's arrays by course id; an array is replaced when it is widened
+        self._courses: dict[int, array] = courses
+        self._course_id: int = course_id
+        self.total: int = 0
+        self.sum_squares: int = 0
+        self.minimum: int | None = None
+        self.maximum: int | None = None
+
+    def __getitem__(self, index: int | slice):
+        grades = self._courses[self._course_id][index]
+        return grades.tolist() if isinstance(index, slice) else grades
+
+    def __len__(self) -> int:
+        return len(self._courses[self._course_id])
+
+    def __iter__(self):
+        return iter(self._courses[self._course_id])
+
+    def __contains__(self, grade) -> bool:
+        return grade in self._courses[self._course_id]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, ColumnarGrades)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def _extend(self, grades: list) -> None:
+        self._store._extend(self._courses, self._course_id, grades)
+
+    def _delete(self, position: int) -> None:
+        self._store._delete(self._courses, self._course_id, position)
+
+    def aggregate(self) -> GradeAggregate:
+        """
+        Return a snapshot of the statistics of the grades as a GradeAggregate.
+        """
+        return GradeAggregate(len(self), self.total, self.sum_squares, self.minimum,
+                              self.maximum)
+
+
+class ColumnarGradeView(Mapping):
+    """
+    A read-only ``{course: [grades]}`` view of one person's grades in a ColumnarGradeStore.
+
+    Reading a course copies its grades out of the store's array into a list.
+    """
+
+    def __init__(self, store: ColumnarGradeStore, person):
+        self.store: ColumnarGradeStore = store
+        self.person = person
+
+    def _columns(self) -> dict[int, array]:
+        store: ColumnarGradeStore = self.store
+        with store._lock:
+            courses: dict[int, array] = store._grades.get(store._person_ids.get(id(self.person)),
+                                                          {})
+            return {course_id: column for course_id, column in courses.items() if column}
+
+    def __getitem__(self, course: str) -> list:
+        column: array | None = self._columns().get(self.store._course_ids.get(course))
+        if column is None:
+            raise KeyError(course)
+        return column.tolist()
+
+    def __iter__(self):
+        return iter([self.store.courses[course_id] for course_id in self._columns()])
+
+    def __len__(self) -> int:
+        return len(self._columns())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -0,0 +1,144 @@
+# Pairwise comparison matrices of the people of a course, refreshed incrementally
+from collections.abc import Iterable
+
+from netology_oop.model import Lecturer, RatingListener
+
+
+class _CourseMatrix:
+    __slots__ = ('people', 'positions', 'keys', 'rows', 'dirty')
+
+    def __init__(self):
+        self.people: list = []
+        self.positions: dict[int, int] = {}
+        self.keys: list[float] = []
+        self.rows: list[list[int]] = []
+        self.dirty: set[int] = set()
+
+
+class ComparisonMatrix(RatingListener):
+    """
+    For every course, how each pair of lecturers compares by their course average.
+
+    Cell [i][j] is 1 if person i has the higher average for the course, -1 if the lower and
+    0 if they are equal, with averages rounded to one decimal place like the ``>`` and
+    ``==`` operators do; people without grades rank last. Ratings only mark the rated
+    person dirty, and refresh() recomputes the rows and columns of dirty people from their
+    running aggregates: O(dirty * n) instead of O(n²) comparisons.
+
+    Attributes:
+        role (type): Lecturer or Student, the kind of person being compared.
+    """
+
+    def __init__(self, role: type = None):
+        self.role: type = Lecturer if role is None else role
+        self._courses: dict[str, _CourseMatrix] = {}
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        """
+        Mark a freshly rated person dirty, adding it to the course if needed.
+        """
+        if isinstance(owner, self.role):
+            self.add(owner, course)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Mark a person whose grades were taken back dirty.
+        """
+        if isinstance(owner, self.role):
+            self.add(owner, course)
+
+    def restored(self, owner, course: str, record) -> None:
+        """
+        Mark a person whose completed course was put back dirty.
+        """
+        if isinstance(owner, self.role):
+            self.add(owner, course)
+
+    def add(self, person, course: str) -> None:
+        """
+        Include a person in the matrix of a course and mark it dirty.
+        """
+        matrix: _CourseMatrix = self._courses.get(course)
+        if matrix is None:
+            matrix = self._courses[course] = _CourseMatrix()
+        position: int | None = matrix.positions.get(id(person))
+        if position is None:
+            position = matrix.positions[id(person)] = len(matrix.people)
+            matrix.people.append(person)
+            matrix.keys.append(float('-inf'))
+            for row in matrix.rows:
+                row.append(0)
+            matrix.rows.append([0] * len(matrix.people))
+        matrix.dirty.add(position)
+
+    def load(self, people: Iterable) -> 'ComparisonMatrix':
+        """
+        Add people to the matrices of the courses attached to them or graded for them.
+
+        Returns:
+            ComparisonMatrix: The matrix itself.
+        """
+        for person in people:
+            if isinstance(person, self.role):
+                courses = getattr(person, 'courses_attached', None)
+                if courses is None:
+                    courses = person.courses_in_progress
+                for course in dict.fromkeys([*courses, *person.grades]):
+                    self.add(person, course)
+        return self
+
+    @staticmethod
+    def _key(person, course: str) -> float:
+        stats = person.grades.course_stats.get(course)
+        if stats is None or not stats.count:
+            return float('-inf')
+        return round(stats.total / stats.count, 1)
+
+    def refresh(self, course: str) -> int:
+        """
+        Recompute the rows and columns of the people of a course marked dirty.
+
+        Returns:
+            int: The number of people refreshed.
+        """
+        matrix: _CourseMatrix = self._courses.get(course)
+        if matrix is None or not matrix.dirty:
+            return 0
+        keys: list[float] = matrix.keys
+        rows: list[list[int]] = matrix.rows
+        dirty: list[int] = sorted(matrix.dirty)
+        for position in dirty:
+            keys[position] = self._key(matrix.people[position], course)
+        for position in dirty:
+            key: float = keys[position]
+            row: list[int] = rows[position]
+            for other, other_key in enumerate(keys):
+                result: int = (key > other_key) - (key < other_key)
+                row[other] = result
+                rows[other][position] = -result
+        matrix.dirty.clear()
+        return len(dirty)
+
+    def matrix(self, course: str) -> tuple[list, list[list[int]]]:
+        """
+        Return the people of a course and their comparison rows, refreshed.
+
+        Returns:
+            tuple: The people in matrix order and a copy of the rows.
+        """
+        self.refresh(course)
+        matrix: _CourseMatrix = self._courses.get(course)
+        if matrix is None:
+            return [], []
+        return list(matrix.people), [list(row) for row in matrix.rows]
+
+    def compare(self, course: str, first, second) -> int:
+        """
+        Return 1, 0 or -1 as first has a higher, equal or lower average for a course.
+
+        Raises:
+            KeyError: If either person is not in the matrix of the course.
+        """
+        self.refresh(course)
+        matrix: _CourseMatrix = self._courses[course]
+        return matrix.rows[matrix.positions[id(first)]][matrix.positions[id(second)]]
@@ -0,0 +1,81 @@
+# The homework demo: builds two people of every kind, rates them and prints the report
+from netology_oop.model import Lecturer, Reviewer, Student
+from netology_oop.stats import average_rating
+
+
+def main() -> None:
+    """
+    Run the TASK 1-4 demonstration and print its report.
+    """
+    # Students
+    evelina_sokolova = Student('Эвелина', 'Соколова', 'Женщина')
+    sergey_makarov = Student('Сергей', 'Макаров', 'Мужчина')
+    # Students / Finished courses
+    evelina_sokolova.finished_courses += ['Вводный модуль', 'Основы Python']
+    sergey_makarov.finished_courses += ['Вводный модуль', 'Основы Python']
+    # Students / Courses in progress
+    evelina_sokolova.courses_in_progress += ['Git', 'Python']
+    sergey_makarov.courses_in_progress += ['Git', 'Python']
+
+    # Reviewers
+    maxim_reviewer = Reviewer('Максим', 'Романов', 'Мужчина')
+    garik_reviewer = Reviewer('Гарик', 'Добрый', 'Мужчина')
+    # Reviewers / Courses in progress
+    maxim_reviewer.courses_attached += ['Python']
+    garik_reviewer.courses_attached += ['Git']
+
+    # Lecturers
+    oleg_lecturer = Lecturer('Олег', 'Темнов', 'Мужчина')
+    dima_lecturer = Lecturer('Дмитрий', 'Окунев', 'Мужчина')
+    # Lecturers / Courses attached
+    oleg_lecturer.courses_attached += ['Git', 'Python']
+    dima_lecturer.courses_attached += ['Python']
+
+    # The reviewer gives a grade to the student
+    # (Each element in the list, which is passed as a grade parameter, represents the grade for a
+    # single lesson)
+    garik_reviewer.rate_student(evelina_sokolova, 'Git', [8, 7])
+    maxim_reviewer.rate_student(evelina_sokolova, 'Python', [10, 10, 8])
+    garik_reviewer.rate_student(sergey_makarov, 'Git', [6, 8])
+    maxim_reviewer.rate_student(sergey_makarov, 'Python', [9, 10, 7])
+
+    # A student gives a grade to the lecture for a course
+    evelina_sokolova.rate_lecturer(oleg_lecturer, 'Git', 8)
+    evelina_sokolova.rate_lecturer(oleg_lecturer, 'Python', 10)
+    evelina_sokolova.rate_lecturer(dima_lecturer, 'Python', 9)
+    sergey_makarov.rate_lecturer(oleg_lecturer, 'Git', 5)
+    sergey_makarov.rate_lecturer(oleg_lecturer, 'Python', 7)
+    sergey_makarov.rate_lecturer(dima_lecturer, 'Python', 8)
+
+    print('= TASK 1 and 2 =')
+    # Displaying the result of the code on the screen for checking
+    print('[Student] Evelina Sokolova:', evelina_sokolova.grades)
+    print('[Student] Sergey Makarov:', sergey_makarov.grades)
+    print('[Lecturer] Oleg Temnov:', oleg_lecturer.grades)
+
+    # Print for 3 Task
+    print('', '= TASK 3 =', '#1 Перезагрузка метода', sep='\n')
+    print('— Reviewer —', maxim_reviewer, sep='\n')
+    print('', '— 1 Lecturer —', oleg_lecturer, sep='\n')
+    print('', '— 2 Lecturer —', dima_lecturer, sep='\n')
+    print('', '— 1 Student —', evelina_sokolova, sep='\n')
+    print('', '— 2 Student —', sergey_makarov, sep='\n')
+
+    print('', '#2 Реализуйте возможность сравнивать', sep='\n')
+    print('- Students')
+    print(evelina_sokolova.compare_summary(sergey_makarov))
+    print(evelina_sokolova.equality_summary(sergey_makarov))
+    print('- Lecturers')
+    print(oleg_lecturer.compare_summary(dima_lecturer))
+    print(oleg_lecturer.equality_summary(dima_lecturer))
+
+    average_s_text: str = ('Средняя оценка за домашние задания по всем студентам в рамках '
+                           'конкретного курса:')
+    average_l_text: str = 'Средняя оценка за лекции всех лекторов в рамках конкретного курса:'
+    average_s_rating: float = average_rating('Python',
+                                              [evelina_sokolova.grades, sergey_makarov.grades])
+    average_l_rating: float = average_rating('Git', [oleg_lecturer.grades, dima_lecturer.grades])
+
+    print('', '= TASK 4 =', sep='\n')
+    print(average_s_text, average_s_rating)
+    print(average_l_text, average_l_rating)
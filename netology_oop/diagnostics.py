@@ -0,0 +1,141 @@
+# Self-checks: the concurrent rating stress test and memory measurements
+import contextlib
+import sys
+import threading
+import time
+import tracemalloc
+
+from netology_oop import model
+from netology_oop.model import GradeAggregate, GradeBook, RatingListener, Reviewer, Student
+from netology_oop.stats import course_index
+
+
+# Concurrency check
+class _Section:
+    """
+    Counts how often two threads were inside the same guarded section at once.
+
+    Every visitor yields the GIL while inside, so without a lock around the section other
+    threads reliably enter it too.
+    """
+
+    def __init__(self):
+        self.overlaps: int = 0
+        self._inside: dict = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def visit(self, key):
+        with self._lock:
+            if self._inside.get(key):
+                self.overlaps += 1
+            self._inside[key] = self._inside.get(key, 0) + 1
+        try:
+            time.sleep(0)
+            yield
+        finally:
+            with self._lock:
+                self._inside[key] -= 1
+
+
+class _CheckedGradeBook(GradeBook):
+    __slots__ = ('section',)
+
+    def _append(self, course: str, grades: list, timestamp: float, rater=None) -> None:
+        with self.section.visit(id(self)):
+            super()._append(course, grades, timestamp, rater)
+
+
+class _CheckedListener(RatingListener):
+    def __init__(self, section: _Section):
+        self.section: _Section = section
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        with self.section.visit(course):
+            pass
+
+
+def concurrent_rating_stress_test(workers: int = 8, ratings: int = 20_000,
+                                  students: int = 4) -> int:
+    """
+    Rate a few students from many threads at once and verify the locks keep writes apart.
+
+    The students' GradeBooks and an extra listener record whether two threads were ever
+    writing the grades of one student, or notifying listeners of one course, at the same
+    time; both yield the GIL inside, so the test fails if the locks are missing. The grade
+    lists and aggregates are then checked for lost updates.
+
+    Args:
+        workers (int): The number of threads in the pool.
+        ratings (int): The number of rate_student calls to submit.
+        students (int): The number of students sharing those ratings.
+
+    Returns:
+        int: The number of grades written.
+
+    Raises:
+        AssertionError: If writes overlapped or the grade lists or aggregates do not add up.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    course: str = 'Stress test'
+    reviewer: Reviewer = Reviewer('Нагрузочный', 'Проверяющий', 'Мужчина')
+    reviewer.courses_attached += [course]
+    person_section: _Section = _Section()
+    course_section: _Section = _Section()
+    cohort: list[Student] = []
+    for number in range(students):
+        student: Student = Student('Студент', str(number), 'Женщина')
+        student.courses_in_progress += [course]
+        student.grades = _CheckedGradeBook(student)
+        student.grades.section = person_section
+        cohort.append(student)
+
+    before: GradeAggregate = GradeAggregate()
+    before.merge(course_index.students.get(course, GradeAggregate()))
+    listener: _CheckedListener = _CheckedListener(course_section).attach()
+    previous_locks: model.ShardedLocks | None = model.rating_locks
+    model.enable_concurrent_rating()
+    try:
+        with ThreadPoolExecutor(workers) as pool:
+            for number in range(ratings):
+                pool.submit(reviewer.rate_student, cohort[number % students], course,
+                            [number % 10 + 1])
+    finally:
+        model.rating_locks = previous_locks
+        listener.detach()
+
+    assert not person_section.overlaps, \
+        f'{person_section.overlaps} writes overlapped with a write to the same student'
+    assert not course_section.overlaps, \
+        f'{course_section.overlaps} notifications overlapped with one for the same course'
+    expected: int = sum(number % 10 + 1 for number in range(ratings))
+    written: int = sum(len(student.grades[course]) for student in cohort)
+    assert written == ratings, f'{ratings - written} grades were lost'
+    assert sum(student.grades.overall.total for student in cohort) == expected
+    assert sum(sum(student.grades[course]) for student in cohort) == expected
+    index: GradeAggregate = course_index.students[course]
+    assert (index.count - before.count, index.total - before.total) == (ratings, expected)
+    return written
+
+
+# Memory footprint
+def bytes_per_instance(factory, count: int = 1_000_000) -> float:
+    """
+    Measure the average memory allocated per object created by a factory.
+
+    Args:
+        factory (callable): Called with the object number, returns a new object.
+        count (int): How many objects to keep alive at once.
+
+    Returns:
+        float: Bytes allocated per object, excluding the list that holds them.
+    """
+    tracemalloc.start()
+    try:
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        objects: list = [factory(number) for number in range(count)]
+        allocated: int = tracemalloc.get_traced_memory()[0] - baseline - sys.getsizeof(objects)
+    finally:
+        tracemalloc.stop()
+    return allocated / len(objects)
@@ -0,0 +1,201 @@
+# Grade distributions: fixed-size histograms per person, per course and per cohort
+from collections.abc import Iterable
+
+from netology_oop.model import RatingListener, Student
+
+
+class GradeHistogram:
+    """
+    Exact counts of every grade on a bounded scale.
+
+    Grades on the ten-point scale are counted in a fixed list, so an update is O(1) and
+    medians, percentiles and histograms are read in time proportional to the scale, not to
+    the number of grades. Grades outside the scale are counted in a small overflow
+    dictionary and still take part in every query.
+
+    Attributes:
+        low (int): The lowest grade of the scale.
+        high (int): The highest grade of the scale.
+        count (int): The number of grades counted.
+    """
+
+    __slots__ = ('low', 'high', 'count', '_counts', '_overflow')
+
+    def __init__(self, low: int = 0, high: int = 10):
+        self.low: int = low
+        self.high: int = high
+        self.count: int = 0
+        self._counts: list[int] = [0] * (high - low + 1)
+        self._overflow: dict[int, int] = {}
+
+    def add(self, grade: int, times: int = 1) -> None:
+        """
+        Count a grade; a negative times removes earlier counts of it.
+        """
+        if self.low <= grade <= self.high:
+            self._counts[grade - self.low] += times
+        else:
+            self._overflow[grade] = self._overflow.get(grade, 0) + times
+            if not self._overflow[grade]:
+                del self._overflow[grade]
+        self.count += times
+
+    def extend(self, grades: Iterable[int]) -> None:
+        for grade in grades:
+            self.add(grade)
+
+    def merge(self, other: 'GradeHistogram') -> None:
+        """
+        Add the counts of another histogram on the same scale.
+        """
+        for index, amount in enumerate(other._counts):
+            self._counts[index] += amount
+        for grade, amount in other._overflow.items():
+            self._overflow[grade] = self._overflow.get(grade, 0) + amount
+        self.count += other.count
+
+    def histogram(self) -> dict[int, int]:
+        """
+        Return the number of occurrences of every grade that occurred, in grade order.
+        """
+        counts: dict[int, int] = {grade: amount for grade, amount in self._overflow.items()}
+        for index, amount in enumerate(self._counts):
+            if amount:
+                counts[self.low + index] = amount
+        return dict(sorted(counts.items()))
+
+    def minimum(self) -> int | None:
+        return next(iter(self.histogram()), None)
+
+    def maximum(self) -> int | None:
+        return next(reversed(self.histogram()), None)
+
+    def _value_at(self, rank: int, items: list[tuple[int, int]]) -> int:
+        seen: int = 0
+        for grade, amount in items:
+            seen += amount
+            if rank < seen:
+                return grade
+        return items[-1][0]
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Return the q-th percentile (0-100) with linear interpolation between ranks.
+
+        This matches ColumnarGradeStore.percentile on the same grades.
+        """
+        if not self.count:
+            return None
+        items: list[tuple[int, int]] = list(self.histogram().items())
+        position: float = (self.count - 1) * q / 100
+        lower: int = int(position)
+        lower_value: int = self._value_at(lower, items)
+        upper_value: int = self._value_at(min(lower + 1, self.count - 1), items)
+        return lower_value + (upper_value - lower_value) * (position - lower)
+
+    def median(self) -> float | None:
+        return self.percentile(50)
+
+    def mean(self) -> float:
+        """
+        Return the mean grade rounded to one decimal place.
+        """
+        if not self.count:
+            return 'Еще нет оценок'
+        total: int = sum(grade * amount for grade, amount in self.histogram().items())
+        return round(total / self.count, 1)
+
+
+class GradeDistribution(RatingListener):
+    """
+    Grade histograms kept up to date for every person and every course.
+
+    Every rating updates the histogram of the rated person for the course, the person's
+    overall histogram and the course-wide histogram of students or lecturers, which is the
+    scope average_rating works on.
+
+    Attributes:
+        low (int): The lowest grade of the scale.
+        high (int): The highest grade of the scale.
+        students (dict): A GradeHistogram of homework grades for every course.
+        lecturers (dict): A GradeHistogram of lecture grades for every course.
+    """
+
+    def __init__(self, low: int = 0, high: int = 10):
+        self.low: int = low
+        self.high: int = high
+        self.students: dict[str, GradeHistogram] = {}
+        self.lecturers: dict[str, GradeHistogram] = {}
+        # id(person) -> (person, {course or None for all courses: histogram}); the person is
+        # held so its id cannot be reused by another person while it has histograms
+        self._people: dict[int, tuple] = {}
+
+    def _histogram(self, table: dict, key) -> GradeHistogram:
+        histogram: GradeHistogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = GradeHistogram(self.low, self.high)
+        return histogram
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        """
+        Count freshly written grades in every histogram they belong to.
+        """
+        self.record(owner, course, grades)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Uncount grades that were taken back.
+        """
+        self.record(owner, course, grades, times=-1)
+
+    def record(self, owner, course: str, grades: list, times: int = 1) -> None:
+        """
+        Count grades of a person for a course; times=-1 removes them again.
+        """
+        entry: tuple | None = self._people.get(id(owner))
+        if entry is None:
+            entry = self._people[id(owner)] = (owner, {})
+        person: dict = entry[1]
+        scopes: tuple = (self._histogram(person, course), self._histogram(person, None),
+                         self._histogram(self.students if isinstance(owner, Student)
+                                         else self.lecturers, course))
+        for grade in grades:
+            for histogram in scopes:
+                histogram.add(grade, times)
+
+    def load(self, people: Iterable) -> 'GradeDistribution':
+        """
+        Count the grades people already have.
+
+        Returns:
+            GradeDistribution: The distribution itself.
+        """
+        for person in people:
+            for course, grades in person.grades.items():
+                self.record(person, course, grades)
+        return self
+
+    def person(self, person, course: str = None) -> GradeHistogram:
+        """
+        Return the histogram of one person for a course, or over all courses.
+        """
+        entry: tuple | None = self._people.get(id(person))
+        histogram: GradeHistogram | None = entry[1].get(course) if entry is not None else None
+        return histogram or GradeHistogram(self.low, self.high)
+
+    def course(self, course_name: str, role: str = 'students') -> GradeHistogram:
+        """
+        Return the histogram of a course for all students or all lecturers.
+        """
+        if role not in ('students', 'lecturers'):
+            raise ValueError("Role must be either 'students' or 'lecturers'.")
+        return getattr(self, role).get(course_name) or GradeHistogram(self.low, self.high)
+
+    def cohort(self, people: Iterable, course: str = None) -> GradeHistogram:
+        """
+        Return the merged histogram of a group of people.
+        """
+        merged: GradeHistogram = GradeHistogram(self.low, self.high)
+        for person in people:
+            merged.merge(self.person(person, course))
+        return merged
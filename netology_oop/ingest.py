@@ -0,0 +1,180 @@
+# Bulk ingestion of grade rows from CSV and JSON Lines files, in chunks
+import csv
+import itertools
+import json
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from typing import NamedTuple
+
+from netology_oop.model import PersonalInfo, rate_rows
+
+
+# Streaming ingestion
+UNKNOWN_PERSON: str = 'unknown person'
+MALFORMED_ROW: str = 'malformed row'
+
+
+def read_grade_rows(path: str, file_format: str = None) -> Iterable[dict]:
+    """
+    Stream grade rows from a CSV or JSON Lines file one row at a time.
+
+    Every row has the keys ``rater``, ``person``, ``course`` and ``grade``, and optionally
+    ``timestamp``. In JSON Lines the grade may also be a list of lesson grades. A JSON line
+    that cannot be parsed is yielded as None, so the row still counts and is reported as
+    malformed.
+
+    Args:
+        path (str): The file to read.
+        file_format (str): 'csv' or 'jsonl'; guessed from the file extension if omitted.
+
+    Yields:
+        dict: One row of the file.
+    """
+    file_format = file_format or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+    with open(path, encoding='utf-8', newline='') as file:
+        if file_format == 'csv':
+            yield from csv.DictReader(file)
+        elif file_format == 'jsonl':
+            for line in file:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        yield None
+        else:
+            raise ValueError("File format must be either 'csv' or 'jsonl'.")
+
+
+def chunked(rows: Iterable, size: int) -> Iterable[list]:
+    """
+    Group a stream into lists of at most size elements.
+    """
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def parse_timestamp(value) -> float | None:
+    """
+    Read the timestamp of a row: seconds since the epoch or an ISO 8601 date and time.
+
+    Args:
+        value: The value of the row's ``timestamp`` key; None or '' if it has none.
+
+    Returns:
+        float: Seconds since the epoch, or None if the row has no timestamp.
+
+    Raises:
+        ValueError: If the value is neither a number nor an ISO 8601 date.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+class IngestReport(NamedTuple):
+    """
+    The outcome of an ingestion run.
+
+    Attributes:
+        rows (int): The number of rows read.
+        rejected (int): The number of rows that were not applied.
+        seconds (float): The wall-clock duration of the run.
+        errors (list): The first rejected rows as (row, course, reason) tuples.
+    """
+    rows: int
+    rejected: int
+    seconds: float
+    errors: list
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+
+class GradeIngestor:
+    """
+    Feed streamed grade rows into the batch rating methods with bounded memory.
+
+    Raters and rated people are resolved by full name through lookup tables. A row whose
+    rater is a Reviewer grades a student; a row whose rater is a Student grades a lecturer.
+    Rows with a missing key or a grade that is not an integer are reported as malformed and
+    skipped. A row's ``timestamp`` (seconds or ISO 8601) says when its grades were given;
+    rows without one use the timestamp of the run. Only one chunk of rows is held in memory
+    at a time.
+
+    Attributes:
+        people (dict): Full name to person lookup table.
+        chunk_size (int): The number of rows applied per batch.
+        max_errors (int): The number of rejected rows kept in the report.
+    """
+
+    def __init__(self, people: Iterable, chunk_size: int = 10_000, max_errors: int = 100):
+        self.people: dict[str, PersonalInfo] = {person.fullname: person for person in people}
+        self.chunk_size: int = chunk_size
+        self.max_errors: int = max_errors
+
+    def ingest_file(self, path: str, file_format: str = None,
+                    timestamp: float = None) -> IngestReport:
+        """
+        Stream a CSV or JSON Lines file into the model.
+        """
+        return self.ingest(read_grade_rows(path, file_format), timestamp)
+
+    def ingest(self, rows: Iterable[dict], timestamp: float = None) -> IngestReport:
+        """
+        Apply a stream of grade rows chunk by chunk.
+
+        Parameters:
+            rows (Iterable): Dictionaries with rater, person, course and grade keys and an
+            optional timestamp key.
+            timestamp (float): When rows without a timestamp were given; defaults to the
+            start of the run.
+
+        Returns:
+            IngestReport: Row counts, duration and a sample of rejected rows.
+        """
+        started: float = time.perf_counter()
+        timestamp = time.time() if timestamp is None else timestamp
+        total: int = 0
+        rejected: int = 0
+        errors: list = []
+        for chunk in chunked(rows, self.chunk_size):
+            chunk_errors: list = self._apply_chunk(chunk, total, timestamp)
+            rejected += len(chunk_errors)
+            errors.extend(chunk_errors[:self.max_errors - len(errors)])
+            total += len(chunk)
+        return IngestReport(total, rejected, time.perf_counter() - started, errors)
+
+    def _apply_chunk(self, chunk: list[dict | None], offset: int,
+                     timestamp: float) -> list[tuple]:
+        errors: list = []
+        batches: dict[int, tuple] = {}
+        for number, row in enumerate(chunk, offset):
+            try:
+                rater = self.people.get(row['rater'])
+                person = self.people.get(row['person'])
+                course: str = row['course']
+                grade = row['grade']
+                grades: list = ([int(value) for value in grade] if isinstance(grade, list)
+                                else [int(grade)])
+                given_at: float | None = parse_timestamp(row.get('timestamp'))
+            except (KeyError, TypeError, ValueError):
+                errors.append((number, row.get('course') if isinstance(row, dict) else None,
+                               MALFORMED_ROW))
+                continue
+            if rater is None or person is None:
+                errors.append((number, course, UNKNOWN_PERSON))
+                continue
+            rater_rows: tuple = batches.setdefault(id(rater), (rater, [], []))
+            rater_rows[1].append(number)
+            rater_rows[2].append((person, course, grades, given_at))
+
+        for rater, numbers, rater_rows in batches.values():
+            errors.extend((numbers[error.row], error.course, error.reason)
+                          for error in rate_rows(rater, rater_rows, timestamp))
+        return errors
@@ -0,0 +1,162 @@
+# An append-only journal of ratings with retractions and corrections
+import threading
+import time
+from typing import NamedTuple
+
+from netology_oop.model import RatingListener, grade_runs, rating_listeners
+
+RATE: str = 'rate'
+RETRACT: str = 'retract'
+CORRECT: str = 'correct'
+
+
+class JournalEntry(NamedTuple):
+    """
+    One line of the rating journal.
+
+    Attributes:
+        entry_id (int): The position of the entry in the journal.
+        action (str): RATE, RETRACT or CORRECT.
+        person (Student | Lecturer): The person whose grades changed.
+        course (str): The course the grades belong to.
+        grades (tuple): The grades that were given or taken back.
+        timestamp (float): When it happened, as seconds since the epoch.
+        target (int): The entry a retraction or correction refers to, otherwise None.
+    """
+    entry_id: int
+    action: str
+    person: object
+    course: str
+    grades: tuple
+    timestamp: float
+    target: int | None
+
+
+class RatingJournal(RatingListener):
+    """
+    Every rating written through a GradeBook, in order, with a way to take it back.
+
+    The journal has to be attached to record anything, and entries are never changed or
+    deleted. retract() removes the grades of an entry through GradeBook.remove, which
+    adjusts the person's aggregates and notifies the other listeners (the course index,
+    leaderboards, distributions, the columnar store) so they subtract the same delta;
+    correct() retracts an entry and writes the replacement grades. Both append a new entry
+    pointing at the one they undo.
+
+    Attributes:
+        entries (list): The JournalEntry records, oldest first.
+    """
+
+    def __init__(self):
+        self.entries: list[JournalEntry] = []
+        self._undone: set[int] = set()
+        # The action, target and timestamp of the write retract() or correct() is making in
+        # this thread; a None timestamp keeps the one the write reports
+        self._pending: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _record(self, action: str, person, course: str, grades: list, timestamp: float,
+                target: int | None) -> None:
+        pending: tuple | None = getattr(self._pending, 'write', None)
+        if pending is not None:
+            action, target, pending_timestamp = pending
+            if pending_timestamp is not None:
+                timestamp = pending_timestamp
+            self._pending.write = None
+        with self._lock:
+            entry: JournalEntry = JournalEntry(len(self.entries), action, person, course,
+                                               tuple(grades), timestamp, target)
+            self.entries.append(entry)
+        self._pending.entry = entry
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float | list) -> None:
+        """
+        Record a rating, as one entry per run of grades given at the same time.
+        """
+        for run, run_timestamp in grade_runs(grades, timestamp):
+            self._record(RATE, owner, course, run, run_timestamp, None)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Record grades taken back, including those removed without going through retract().
+
+        The entry is stamped with the time of the retraction, not given_at.
+        """
+        self._record(RETRACT, owner, course, grades, time.time(), None)
+
+    def _active(self, entry_id: int) -> JournalEntry:
+        if not any(listener is self for listener in rating_listeners):
+            raise ValueError('The journal must be attached to take ratings back.')
+        if not 0 <= entry_id < len(self.entries):
+            raise ValueError(f'There is no journal entry {entry_id}.')
+        entry: JournalEntry = self.entries[entry_id]
+        if entry.action == RETRACT or entry_id in self._undone:
+            raise ValueError(f'Journal entry {entry_id} has nothing left to take back.')
+        return entry
+
+    def retract(self, entry_id: int, timestamp: float = None) -> JournalEntry:
+        """
+        Take back the grades of a rating or a correction.
+
+        Listeners are told the grades were given at the entry's timestamp, so time windows
+        take them out of the windows they were counted in.
+
+        Args:
+            entry_id (int): The entry to take back.
+            timestamp (float): When it is taken back; defaults to now.
+
+        Returns:
+            JournalEntry: The retraction appended to the journal.
+
+        Raises:
+            ValueError: If the entry does not exist, is a retraction or was already undone.
+        """
+        entry: JournalEntry = self._active(entry_id)
+        timestamp = time.time() if timestamp is None else timestamp
+        self._pending.write = (RETRACT, entry_id, timestamp)
+        try:
+            entry.person.grades.remove(entry.course, list(entry.grades), entry.timestamp)
+        finally:
+            self._pending.write = None
+        self._undone.add(entry_id)
+        return self._pending.entry
+
+    def correct(self, entry_id: int, grades: list, timestamp: float = None) -> JournalEntry:
+        """
+        Replace the grades of a rating or a correction.
+
+        Args:
+            entry_id (int): The entry to correct.
+            grades (list): The grades that should have been given.
+            timestamp (float): When the correction is made; defaults to now.
+
+        Returns:
+            JournalEntry: The correction appended to the journal; it can be corrected again.
+        """
+        retraction: JournalEntry = self.retract(entry_id, timestamp)
+        self._pending.write = (CORRECT, entry_id, None)
+        try:
+            retraction.person.grades.add(retraction.course, grades, retraction.timestamp)
+        finally:
+            self._pending.write = None
+        return self._pending.entry
+
+    def find(self, person, course: str = None, action: str = None) -> JournalEntry | None:
+        """
+        Return the latest entry of a person, optionally for a course and an action.
+
+        Rating entries that were already retracted or corrected are skipped.
+        """
+        for entry in reversed(self.entries):
+            if (entry.person is person and course in (None, entry.course)
+                    and action in (None, entry.action)
+                    and entry.entry_id not in self._undone):
+                return entry
+        return None
+
+    def history(self, person, course: str = None) -> list[JournalEntry]:
+        """
+        Return every entry of a person, optionally for one course, oldest first.
+        """
+        return [entry for entry in self.entries
+                if entry.person is person and course in (None, entry.course)]
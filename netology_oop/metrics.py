@@ -0,0 +1,170 @@
+# Opt-in instrumentation of the rating, averaging and rendering hot paths
+import json
+import time
+
+# The recorder the hot paths report to; None keeps instrumentation switched off
+active: 'Metrics | None' = None
+
+
+class Metrics:
+    """
+    Counters, latency histograms and rejection reasons for the hot paths.
+
+    Latencies are kept in power-of-two nanosecond buckets and grade list sizes in
+    power-of-two buckets as well, so recording is a few dictionary updates. The collected
+    numbers are handed to a pluggable sink by flush(). Updates are not synchronized; under
+    concurrent rating some increments may be lost, which is acceptable for monitoring.
+
+    Attributes:
+        sink (callable): Receives the snapshot dictionary on every flush().
+        counters (dict): Call and event counts by name.
+        rejections (dict): Rejected ratings by operation and reason.
+        latencies (dict): A latency histogram for every operation.
+        grade_list_sizes (dict): How many grade lists reached each size bucket.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded so far.
+        """
+        self.counters: dict[str, int] = {}
+        self.rejections: dict[str, dict[str, int]] = {}
+        self.latencies: dict[str, dict[int, int]] = {}
+        self.latency_totals: dict[str, int] = {}
+        self.grade_list_sizes: dict[int, int] = {}
+        self.largest_grade_list: int = 0
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, operation: str, started_ns: int) -> None:
+        """
+        Record one call of an operation that started at started_ns (perf_counter_ns).
+        """
+        elapsed: int = time.perf_counter_ns() - started_ns
+        self.counters[operation] = self.counters.get(operation, 0) + 1
+        self.latency_totals[operation] = self.latency_totals.get(operation, 0) + elapsed
+        buckets: dict[int, int] = self.latencies.setdefault(operation, {})
+        bucket: int = elapsed.bit_length()
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    def reject(self, operation: str, reason: str) -> None:
+        """
+        Record a rejected rating and why it was rejected.
+        """
+        reasons: dict[str, int] = self.rejections.setdefault(operation, {})
+        reasons[reason] = reasons.get(reason, 0) + 1
+
+    def rated(self, operation: str, reason: str | None, started_ns: int) -> None:
+        """
+        Record a rating call: its latency and, if it was rejected, the reason.
+        """
+        self.observe(operation, started_ns)
+        if reason is not None:
+            self.reject(operation, reason)
+
+    def grade_list_size(self, size: int) -> None:
+        """
+        Record the length a grade list reached after an append.
+        """
+        bucket: int = size.bit_length()
+        self.grade_list_sizes[bucket] = self.grade_list_sizes.get(bucket, 0) + 1
+        if size > self.largest_grade_list:
+            self.largest_grade_list = size
+
+    def latency_quantile(self, operation: str, q: float) -> int | None:
+        """
+        Return an upper bound in nanoseconds for the q-quantile (0-1) of an operation.
+        """
+        buckets: dict[int, int] = self.latencies.get(operation)
+        if not buckets:
+            return None
+        threshold: float = q * sum(buckets.values())
+        seen: int = 0
+        for bucket in sorted(buckets):
+            seen += buckets[bucket]
+            if seen >= threshold:
+                return 1 << bucket
+        return 1 << max(buckets)
+
+    def snapshot(self) -> dict:
+        """
+        Return everything recorded so far as plain data.
+        """
+        latency: dict[str, dict] = {}
+        for operation, buckets in self.latencies.items():
+            calls: int = sum(buckets.values())
+            latency[operation] = {
+                'calls': calls,
+                'mean_ns': round(self.latency_totals[operation] / calls),
+                'p50_ns': self.latency_quantile(operation, 0.5),
+                'p99_ns': self.latency_quantile(operation, 0.99),
+                'buckets_ns': {1 << bucket: count for bucket, count in sorted(buckets.items())},
+            }
+        return {'counters': dict(self.counters),
+                'rejections': {operation: dict(reasons)
+                               for operation, reasons in self.rejections.items()},
+                'latency': latency,
+                'grade_list_sizes': {1 << bucket: count for bucket, count
+                                     in sorted(self.grade_list_sizes.items())},
+                'largest_grade_list': self.largest_grade_list}
+
+    def flush(self) -> dict:
+        """
+        Hand a snapshot to the sink and return it.
+        """
+        snapshot: dict = self.snapshot()
+        if self.sink is not None:
+            self.sink(snapshot)
+        return snapshot
+
+
+def enable_metrics(sink=None) -> Metrics:
+    """
+    Start recording the hot paths.
+
+    Args:
+        sink (callable): Receives the snapshot on every flush(), e.g. json_sink(file).
+
+    Returns:
+        Metrics: The active recorder.
+    """
+    global active
+    active = Metrics(sink)
+    return active
+
+
+def disable_metrics() -> Metrics | None:
+    """
+    Stop recording and return the recorder that was active.
+    """
+    global active
+    recorder, active = active, None
+    return recorder
+
+
+def json_sink(file):
+    """
+    Return a sink writing every snapshot as one JSON line to a text file.
+    """
+    def sink(snapshot: dict) -> None:
+        file.write(json.dumps(snapshot, ensure_ascii=False) + '\n')
+    return sink
+
+
+def logging_sink(logger=None, level: int = None):
+    """
+    Return a sink logging every snapshot as JSON, at INFO level by default.
+    """
+    import logging
+
+    logger = logger or logging.getLogger('netology_oop.metrics')
+    level = logging.INFO if level is None else level
+
+    def sink(snapshot: dict) -> None:
+        logger.log(level, 'metrics %s', json.dumps(snapshot, ensure_ascii=False))
+    return sink
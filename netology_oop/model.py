@@ -0,0 +1,1654 @@
+# The people model: students, mentors and the grade containers they share
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping, MutableSet, Sequence
+from typing import NamedTuple
+
+from netology_oop import metrics
+
+
+# Helper classes
+class PersonalInfo:
+    """
+    This class represents personal information of an individual.
+
+    Attributes:
+        name (str): The first name of the individual.
+        surname (str): The last name of the individual.
+        fullname (str): The full name of the individual (combination of first name and last name).
+        gender (str): The gender of the individual.
+
+    Methods:
+        __init__: Initializes the PersonalInfo object with the provided name, surname, and gender.
+    """
+
+    __slots__ = ('_name', '_surname', 'gender')
+
+    def __init__(self, name: str, surname: str, gender: str):
+        if not name or not surname or not gender:
+            raise ValueError('Name, surname, and gender must be non-empty strings.')
+
+        self.name: str = name.strip()
+        self.surname: str = surname.strip()
+        self.gender: str = sys.intern(gender.strip())
+
+    def _renamed(self) -> None:
+        # People that cache their __str__ output render their name in it
+        invalidate_render = getattr(self, 'invalidate_render', None)
+        if invalidate_render is not None:
+            invalidate_render()
+        for listener in rename_listeners:
+            listener(self)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+        self._renamed()
+
+    @property
+    def surname(self) -> str:
+        return self._surname
+
+    @surname.setter
+    def surname(self, surname: str) -> None:
+        self._surname = surname
+        self._renamed()
+
+    @property
+    def fullname(self) -> str:
+        """
+        The full name, built on access instead of being stored on every instance.
+        """
+        return f'{self.name} {self.surname}'
+
+
+# Callables notified as listener(person) after the name or surname of a person changed,
+# including while it is first set by __init__
+rename_listeners: list = []
+
+
+# Callables notified as listener(owner, attribute, course, added) whenever a course joins
+# (added=True) or leaves a CourseSet owned by a person; attribute is 'courses_in_progress',
+# 'finished_courses' or 'courses_attached'
+enrollment_listeners: list = []
+
+
+class CourseSet(MutableSet):
+    """
+    An insertion-ordered set of course names with O(1) membership tests.
+
+    It keeps the list idioms used for courses (``+=``, ``append``, ``extend``) and iterates
+    in insertion order, so ``', '.join(...)`` output is unchanged. Adding a course twice
+    keeps only the first occurrence. Course names are interned.
+
+    The sets of a person are views: the courses themselves are stored on the person under
+    ``_attribute``, as None while there are none, a tuple while there are a few and a dict
+    beyond that, so a person holds no set objects of its own. A view invalidates the
+    owner's cached __str__ output, if it has one, and reports every mutation to
+    enrollment_listeners with the attribute it stands for.
+    """
+
+    __slots__ = ('_courses', '_owner', '_attribute')
+
+    def __init__(self, courses: Iterable[str] = (), owner=None, attribute: str = None):
+        # _courses holds the courses of a set without an owner; a view reads its owner's
+        self._courses: dict[str, None] | None = (dict.fromkeys(map(sys.intern, courses))
+                                                 if owner is None else None)
+        self._owner = owner
+        self._attribute: str | None = attribute
+
+    def _stored(self) -> tuple | dict | None:
+        if self._owner is None:
+            return self._courses
+        return getattr(self._owner, f'_{self._attribute}')
+
+    def _store(self, courses: dict[str, None]) -> None:
+        if self._owner is None:
+            self._courses = courses
+        else:
+            setattr(self._owner, f'_{self._attribute}', _pack_courses(courses))
+
+    def __contains__(self, course) -> bool:
+        courses: tuple | dict | None = self._stored()
+        return courses is not None and course in courses
+
+    def __iter__(self):
+        return iter(self._stored() or ())
+
+    def __len__(self) -> int:
+        return len(self._stored() or ())
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def add(self, course: str) -> None:
+        course = sys.intern(course)
+        courses: tuple | dict | None = self._stored()
+        if courses is None or course not in courses:
+            changed: dict[str, None] = (courses if isinstance(courses, dict)
+                                        else dict.fromkeys(courses or ()))
+            changed[course] = None
+            self._store(changed)
+            self._changed(course, True)
+
+    def discard(self, course: str) -> None:
+        courses: tuple | dict | None = self._stored()
+        if courses is not None and course in courses:
+            changed: dict[str, None] = (courses if isinstance(courses, dict)
+                                        else dict.fromkeys(courses))
+            del changed[course]
+            self._store(changed)
+            self._changed(course, False)
+
+    def _changed(self, course: str, added: bool) -> None:
+        owner = self._owner
+        if owner is not None:
+            invalidate_render = getattr(owner, 'invalidate_render', None)
+            if invalidate_render is not None:
+                invalidate_render()
+            for listener in enrollment_listeners:
+                listener(owner, self._attribute, course, added)
+
+    def append(self, course: str) -> None:
+        self.add(course)
+
+    def extend(self, courses: Iterable[str]) -> None:
+        for course in courses:
+            self.add(course)
+
+    def __iadd__(self, courses: Iterable[str]) -> 'CourseSet':
+        self.extend(courses)
+        return self
+
+
+# Up to this many courses are stored on a person as a tuple, which a membership test scans
+# about as fast as a dict lookup at a fraction of the size
+_COURSE_TUPLE_LIMIT: int = 8
+
+
+def _pack_courses(courses: dict[str, None]) -> tuple | dict | None:
+    # The compact form of a person's courses: None, a tuple of a few names or the dict itself
+    if not courses:
+        return None
+    if len(courses) <= _COURSE_TUPLE_LIMIT:
+        return tuple(courses)
+    return courses
+
+
+def _replace_courses(owner, attribute: str, courses: Iterable[str]) -> bool:
+    """
+    Store new courses on a person, reporting the courses that left and joined.
+
+    Args:
+        owner: The person the courses belong to.
+        attribute (str): The public name of the attribute; the courses are kept in
+        ``_attribute``.
+        courses (Iterable): The new courses.
+
+    Returns:
+        bool: False if courses already is the person's own view and nothing was replaced.
+    """
+    if (isinstance(courses, CourseSet) and courses._owner is owner
+            and courses._attribute == attribute):
+        return False
+    old: tuple | dict = getattr(owner, f'_{attribute}', None) or ()
+    new: dict[str, None] = dict.fromkeys(map(sys.intern, courses))
+    setattr(owner, f'_{attribute}', _pack_courses(new))
+    view: CourseSet = CourseSet(owner=owner, attribute=attribute)
+    for course in old:
+        if course not in new:
+            view._changed(course, False)
+    for course in new:
+        if course not in old:
+            view._changed(course, True)
+    return True
+
+
+def _summarize(grades: list) -> tuple[int, int, int, int]:
+    # The sum, sum of squares, minimum and maximum of the non-empty grades of one write, in
+    # one pass; writes hold a few grades, where a local loop beats sum(), min() and max()
+    if len(grades) == 1:
+        grade: int = grades[0]
+        return grade, grade * grade, grade, grade
+    total: int = 0
+    squares: int = 0
+    low: int = grades[0]
+    high: int = low
+    for grade in grades:
+        total += grade
+        squares += grade * grade
+        if grade < low:
+            low = grade
+        elif grade > high:
+            high = grade
+    return total, squares, low, high
+
+
+class GradeAggregate:
+    """
+    Running statistics over a stream of grades.
+
+    Every update is O(1), so the average, minimum, maximum and spread of the grades can be
+    read without touching the grade lists themselves.
+
+    Attributes:
+        count (int): The number of grades seen.
+        total (int): The sum of the grades.
+        sum_squares (int): The sum of the squared grades.
+        minimum (int): The lowest grade seen, or None if there are no grades yet.
+        maximum (int): The highest grade seen, or None if there are no grades yet.
+    """
+
+    __slots__ = ('count', 'total', 'sum_squares', 'minimum', 'maximum')
+
+    def __init__(self, count: int = 0, total: int = 0, sum_squares: int = 0,
+                 minimum: int = None, maximum: int = None):
+        self.count: int = count
+        self.total: int = total
+        self.sum_squares: int = sum_squares
+        self.minimum: int | None = minimum
+        self.maximum: int | None = maximum
+
+    def add(self, grade: int) -> None:
+        """
+        Add a single grade to the running statistics.
+
+        Args:
+            grade (int): The grade to add.
+        """
+        self.count += 1
+        self.total += grade
+        self.sum_squares += grade * grade
+        if self.minimum is None or grade < self.minimum:
+            self.minimum = grade
+        if self.maximum is None or grade > self.maximum:
+            self.maximum = grade
+
+    def remove(self, grade: int) -> None:
+        """
+        Take a grade back out of the running statistics.
+
+        The count, total and sum of squares are adjusted by delta. The minimum and maximum
+        cannot be restored without the remaining grades, so they stay as bounds until the
+        owner of the grades refreshes them (see GradeBook.remove).
+
+        Args:
+            grade (int): The grade to remove.
+        """
+        self.count -= 1
+        self.total -= grade
+        self.sum_squares -= grade * grade
+        if not self.count:
+            self.minimum = self.maximum = None
+
+    def extend(self, grades: list) -> None:
+        """
+        Add the grades of one write to the running statistics at once.
+
+        The sums and extremes of the write are taken in one pass and applied in one update,
+        instead of one add() call per grade.
+
+        Args:
+            grades (list): The grades to add.
+        """
+        if not grades:
+            return
+        total, squares, low, high = _summarize(grades)
+        self.count += len(grades)
+        self.total += total
+        self.sum_squares += squares
+        if self.minimum is None or low < self.minimum:
+            self.minimum = low
+        if self.maximum is None or high > self.maximum:
+            self.maximum = high
+
+    def merge(self, other: 'GradeAggregate') -> None:
+        """
+        Fold the statistics of another aggregate into this one.
+
+        Args:
+            other (GradeAggregate): The aggregate to merge.
+        """
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.sum_squares += other.sum_squares
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+
+    def average(self) -> float:
+        """
+        Return the average grade rounded to one decimal place.
+
+        Returns:
+            float: The average grade, or 'Еще нет оценок' if there are no grades yet.
+        """
+        if not self.count:
+            return 'Еще нет оценок'
+        return round(self.total / self.count, 1)
+
+    def variance(self) -> float:
+        """
+        Return the population variance of the grades.
+
+        Returns:
+            float: The variance, or None if there are no grades yet.
+        """
+        if not self.count:
+            return None
+        mean: float = self.total / self.count
+        return self.sum_squares / self.count - mean * mean
+
+
+class CourseRecord(NamedTuple):
+    """
+    The final statistics of a completed course, frozen in place of its GradeAggregate.
+
+    It has the fields and read methods of a GradeAggregate, so averages, merges and
+    reports treat completed and running courses alike.
+
+    Attributes:
+        count (int): The number of grades.
+        total (int): The sum of the grades.
+        sum_squares (int): The sum of the squared grades.
+        minimum (int): The lowest grade.
+        maximum (int): The highest grade.
+    """
+    count: int
+    total: int
+    sum_squares: int
+    minimum: int | None
+    maximum: int | None
+
+    average = GradeAggregate.average
+    variance = GradeAggregate.variance
+
+
+# Callables notified after every write to a GradeBook as
+# listener(owner, course, grades, timestamp), the timestamp being seconds since the epoch.
+# Listeners with a retracted(owner, course, grades, given_at) method are also told when
+# grades are removed again, given_at being when the removed grades had been given, and
+# listeners with a restored(owner, course, record) method when GradeBook.restore puts back
+# the CourseRecord of a completed course.
+rating_listeners: list = []
+
+
+class ShardedLocks:
+    """
+    Two pools of locks for concurrent rating: one sharded by person, one by course.
+
+    A GradeBook write holds the lock of its owner's shard while it updates the grades and
+    then the lock of the course's shard while it notifies rating_listeners, so writes to
+    different people and courses proceed in parallel and no update is lost.
+
+    Attributes:
+        shards (int): The number of locks in each pool.
+    """
+
+    __slots__ = ('shards', '_person_locks', '_course_locks')
+
+    def __init__(self, shards: int = 64):
+        self.shards: int = shards
+        self._person_locks: list = [threading.Lock() for _ in range(shards)]
+        self._course_locks: list = [threading.Lock() for _ in range(shards)]
+
+    def person(self, person) -> threading.Lock:
+        # Object ids are aligned and evenly spaced, so their low bits would pick only a few
+        # shards; multiplicative hashing mixes the higher bits into the shard number
+        return self._person_locks[(id(person) * 0x9E3779B97F4A7C15 >> 32) % self.shards]
+
+    def course(self, course: str) -> threading.Lock:
+        return self._course_locks[hash(course) % self.shards]
+
+
+# Set by enable_concurrent_rating(); None keeps the single-threaded fast path
+rating_locks: ShardedLocks | None = None
+
+
+def enable_concurrent_rating(shards: int = 64) -> ShardedLocks:
+    """
+    Make rating safe to call from several threads at once.
+
+    Args:
+        shards (int): The number of locks per pool.
+
+    Returns:
+        ShardedLocks: The locks now guarding GradeBook writes.
+    """
+    global rating_locks
+    rating_locks = ShardedLocks(shards)
+    return rating_locks
+
+
+def disable_concurrent_rating() -> None:
+    """
+    Return to unsynchronized, single-threaded rating.
+    """
+    global rating_locks
+    rating_locks = None
+
+
+class GradeWrite(NamedTuple):
+    """
+    One write of consecutive grades to a course, kept while grade history is enabled.
+
+    Attributes:
+        count (int): The number of grades the write appended.
+        timestamp (float): When they were given, or None if that was not recorded.
+        rater: The reviewer or student who gave them, or None if that was not recorded.
+    """
+    count: int
+    timestamp: float | None
+    rater: object = None
+
+
+def grade_runs(grades: list, timestamp: float | list) -> list[tuple[list, float]]:
+    """
+    Split grades written together into runs of grades given at the same time.
+
+    Args:
+        grades (list): The grades of one write.
+        timestamp (float | list): When they were given: one time for all of them, or a list
+        with one time per grade.
+
+    Returns:
+        list: (grades, timestamp) pairs in the order of the grades.
+    """
+    if not isinstance(timestamp, list):
+        return [(grades, timestamp)]
+    runs: list[tuple[list, float]] = []
+    start: int = 0
+    for end in range(1, len(grades) + 1):
+        if end == len(grades) or timestamp[end] != timestamp[start]:
+            runs.append((grades[start:end], timestamp[start]))
+            start = end
+    return runs
+
+
+# Set by enable_grade_history(); when False, GradeBooks do not record when grades were given
+keep_grade_history: bool = False
+
+
+def enable_grade_history() -> None:
+    """
+    Record when and by whom every write to a GradeBook was given, from now on.
+
+    The history costs one GradeWrite per write, not per grade. It is what GradeBook.given_at
+    answers from, what save_model persists, what reviewer weights of GradeWeights are
+    applied by and what lets a retraction tell listeners when the grades were given;
+    without it they are told the time of the retraction.
+    """
+    global keep_grade_history
+    keep_grade_history = True
+
+
+def disable_grade_history() -> None:
+    """
+    Stop starting grade history for more courses.
+
+    Courses that already have a history keep recording it, so it stays aligned with their
+    grades.
+    """
+    global keep_grade_history
+    keep_grade_history = False
+
+
+# Set by enable_grade_storage(); None keeps the grades of every course in a GradeList
+grade_storage: Callable[[object, str], Sequence] | None = None
+
+
+def enable_grade_storage(factory: Callable[[object, str], Sequence]) -> None:
+    """
+    Keep the grades of the courses GradeBooks start from now on outside GradeLists.
+
+    Courses that already have grades stay in their GradeLists.
+
+    Args:
+        factory (Callable): Called with the owner of a GradeBook and a course when the book
+        gets the first grades of the course, such as ColumnarGradeStore.grades_for. It returns
+        the empty sequence to keep them in, which carries the statistics of a GradeList and
+        is changed by the book through its ``_extend(grades)`` and ``_delete(position)``.
+    """
+    global grade_storage
+    grade_storage = factory
+
+
+def disable_grade_storage() -> None:
+    """
+    Keep the grades of the courses GradeBooks start from now on in GradeLists again.
+    """
+    global grade_storage
+    grade_storage = None
+
+
+class GradeList(list):
+    """
+    The grades of one course in a GradeBook: a list that can be read but not changed.
+
+    Changing it in place would leave the aggregates of its GradeBook stale, so grades are
+    added with GradeBook.add and taken back with GradeBook.remove. Copies and pickles are
+    plain lists.
+
+    The list carries the running statistics of its grades itself, its length being their
+    count, so a course costs no aggregate object of its own.
+
+    Attributes:
+        total (int): The sum of the grades.
+        sum_squares (int): The sum of the squared grades.
+        minimum (int): The lowest grade, or None if there are no grades.
+        maximum (int): The highest grade, or None if there are no grades.
+    """
+
+    __slots__ = ('total', 'sum_squares', 'minimum', 'maximum')
+
+    def __init__(self, grades: Iterable[int] = ()):
+        super().__init__(grades)
+        self.total, self.sum_squares, self.minimum, self.maximum = (
+            _summarize(self) if self else (0, 0, None, None))
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Grades are changed through GradeBook.add and GradeBook.remove.')
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    # How the GradeBook changes the list
+    _extend = list.extend
+    _delete = list.__delitem__
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def aggregate(self) -> GradeAggregate:
+        """
+        Return a snapshot of the statistics of the grades as a GradeAggregate.
+        """
+        return GradeAggregate(len(self), self.total, self.sum_squares, self.minimum,
+                              self.maximum)
+
+
+class _CourseStats(Mapping):
+    # The course_stats of a GradeBook: a read-only view computed from its GradeLists and
+    # the CourseRecords of its completed courses, which take precedence
+
+    __slots__ = ('_book',)
+
+    def __init__(self, book: 'GradeBook'):
+        self._book: GradeBook = book
+
+    def __getitem__(self, course: str) -> GradeAggregate | CourseRecord:
+        records: dict[str, CourseRecord] | None = self._book._records
+        if records is not None and course in records:
+            return records[course]
+        return dict.__getitem__(self._book, course).aggregate()
+
+    def __contains__(self, course) -> bool:
+        records: dict[str, CourseRecord] | None = self._book._records
+        return dict.__contains__(self._book, course) or records is not None and course in records
+
+    def __iter__(self):
+        yield from dict.__iter__(self._book)
+        records: dict[str, CourseRecord] | None = self._book._records
+        if records is not None:
+            for course in records:
+                if not dict.__contains__(self._book, course):
+                    yield course
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class GradeBook(dict):
+    """
+    A dictionary of grades per course that keeps running aggregates up to date.
+
+    It still reads like the plain ``{course: [grades]}`` dictionary used before, but the
+    per-course and total statistics are maintained on every write, so averages are answered
+    in constant time. The dictionary and its GradeLists are read-only: every change goes
+    through add() and remove(), so the aggregates always agree with the grades.
+
+    The statistics of a running course live on its GradeList and those of a completed course
+    in a CourseRecord; course_stats and overall present them as GradeAggregates, built when
+    they are read. After enable_grade_storage, courses started from then on keep their grades
+    and statistics in the sequence its factory returns instead of a GradeList.
+
+    While grade history is enabled (see enable_grade_history), the book also records every
+    write as a GradeWrite, so it can tell when and by whom each grade was given.
+
+    Attributes:
+        owner: The person the grades belong to.
+        grade_count (int): The number of grades over all courses.
+        grade_total (int): The sum of the grades over all courses.
+        course_stats (Mapping): A GradeAggregate, or a CourseRecord once completed, for
+        every course.
+        overall (GradeAggregate): The aggregate over all courses.
+    """
+
+    __slots__ = ('owner', 'grade_count', 'grade_total', '_records', '_history')
+
+    def __init__(self, owner=None):
+        super().__init__()
+        self.owner = owner
+        self.grade_count: int = 0
+        self.grade_total: int = 0
+        # The CourseRecords of completed courses; None until a course is completed
+        self._records: dict[str, CourseRecord] | None = None
+        # The GradeWrites of every course, oldest first; None until history is recorded
+        self._history: dict[str, list[GradeWrite]] | None = None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Grades are changed through GradeBook.add and GradeBook.remove.')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    setdefault = update = pop = popitem = clear = _read_only
+
+    def __reduce__(self):
+        # Copies and pickles are rebuilt as GradeBooks with their aggregates, history and
+        # records; listeners are not told, the grades being theirs already
+        return _rebuild_grade_book, (type(self), self.owner, dict(self), self._history,
+                                     self._records)
+
+    @property
+    def course_stats(self) -> Mapping:
+        return _CourseStats(self)
+
+    @property
+    def overall(self) -> GradeAggregate:
+        overall: GradeAggregate = GradeAggregate()
+        for stats in self.course_stats.values():
+            overall.merge(stats)
+        return overall
+
+    def add(self, course: str, grades: list, timestamp: float | list = None,
+            rater=None) -> None:
+        """
+        Append grades for a course and update the aggregates.
+
+        Args:
+            course (str): The course the grades belong to.
+            grades (list): The grades to append.
+            timestamp (float | list): When the grades were given, as seconds since the epoch,
+            or a list with one such time per grade; defaults to now. Passed on to
+            rating_listeners as given.
+            rater: Who gave the grades; kept in the grade history with the timestamp.
+
+        Raises:
+            ValueError: If the course is completed or timestamp has a time for every grade
+            but not as many times as grades.
+        """
+        if self.is_frozen(course):
+            raise ValueError(f'The grades of the completed course {course!r} are frozen.')
+        self._write(course, grades, timestamp, rater)
+
+    def _write(self, course: str, grades: list, timestamp: float | list = None,
+               rater=None) -> None:
+        # add() without the frozen check, for callers that already refused completed courses
+        if isinstance(timestamp, list) and len(timestamp) != len(grades):
+            raise ValueError(f'{len(grades)} grades were given with {len(timestamp)} times.')
+        timestamp = time.time() if timestamp is None else timestamp
+        locks: ShardedLocks | None = rating_locks
+        if locks is None:
+            self._append(course, grades, timestamp, rater)
+            for listener in rating_listeners:
+                listener(self.owner, course, grades, timestamp)
+            return
+        with locks.person(self.owner):
+            self._append(course, grades, timestamp, rater)
+        with locks.course(course):
+            for listener in rating_listeners:
+                listener(self.owner, course, grades, timestamp)
+
+    def remove(self, course: str, grades: list, given_at: float = None) -> None:
+        """
+        Take back grades previously added for a course and adjust the aggregates by delta.
+
+        The latest occurrence of every grade is removed from the course's list, searching
+        from its end where recent grades are; with grade history and given_at, the latest
+        occurrence given at that time is preferred. A course left without grades disappears
+        from the book. Listeners with a ``retracted`` method are told about the removal.
+
+        Args:
+            course (str): The course the grades belong to.
+            grades (list): The grades to remove.
+            given_at (float): When the removed grades had been given, so the grades of that
+            write are taken back and time windows can take them out of the right window;
+            defaults to the latest recorded timestamp of the removed grades, or now without
+            grade history.
+
+        Raises:
+            ValueError: If the course does not have all of these grades or is completed.
+        """
+        locks: ShardedLocks | None = rating_locks
+        if locks is None:
+            latest: float = self._remove(course, grades, given_at)
+            self._notify_retracted(course, grades, latest if given_at is None else given_at)
+            return
+        with locks.person(self.owner):
+            latest = self._remove(course, grades, given_at)
+        given_at = latest if given_at is None else given_at
+        with locks.course(course):
+            self._notify_retracted(course, grades, given_at)
+
+    def _notify_retracted(self, course: str, grades: list, given_at: float) -> None:
+        for listener in rating_listeners:
+            retracted = getattr(listener, 'retracted', None)
+            if retracted is not None:
+                retracted(self.owner, course, grades, given_at)
+
+    def _remove(self, course: str, grades: list, given_at: float = None) -> float:
+        if self.is_frozen(course):
+            raise ValueError(f'The grades of the completed course {course!r} are frozen.')
+        course_grades: list = self.get(course, [])
+        writes: list[GradeWrite] | None = (self._history.get(course)
+                                           if self._history is not None else None)
+        # Equal grades of other writes are only taken when none was given at given_at
+        given: list | None = self.given_at(course) if writes and given_at is not None else None
+        # The positions to delete are all found before anything is changed
+        positions: list[int] = []
+        for grade in grades:
+            position: int = -1
+            for candidate in range(len(course_grades) - 1, -1, -1):
+                if course_grades[candidate] != grade or candidate in positions:
+                    continue
+                if given is None or given[candidate] == given_at:
+                    position = candidate
+                    break
+                if position < 0:
+                    position = candidate
+            if position < 0:
+                raise ValueError(f'Not all of {grades} were given for {course!r}.')
+            positions.append(position)
+        if not positions:
+            return time.time()
+        given: list[float] = []
+        for position in sorted(positions, reverse=True):
+            course_grades._delete(position)
+            if writes:
+                given.append(_forget_grade(writes, position))
+        removed: int = sum(grades)
+        course_grades.total -= removed
+        course_grades.sum_squares -= sum(grade * grade for grade in grades)
+        self.grade_count -= len(grades)
+        self.grade_total -= removed
+        if not course_grades:
+            dict.__delitem__(self, course)
+            if writes is not None:
+                del self._history[course]
+        elif course_grades.minimum in grades or course_grades.maximum in grades:
+            # The extremes cannot be adjusted by delta; only this course's list is read
+            course_grades.minimum, course_grades.maximum = min(course_grades), max(course_grades)
+        if self.owner is not None:
+            self.owner.invalidate_render()
+        known: list[float] = [timestamp for timestamp in given if timestamp is not None]
+        return max(known) if known else time.time()
+
+    def history(self, course: str) -> list[GradeWrite]:
+        """
+        Return the recorded writes of a course, oldest first.
+
+        Grades written while history was disabled form a first write without a timestamp.
+
+        Args:
+            course (str): The course to look up.
+
+        Returns:
+            list: GradeWrites whose counts add up to the number of grades; empty if no
+            history was recorded for the course.
+        """
+        if self._history is None:
+            return []
+        return list(self._history.get(course, ()))
+
+    def given_at(self, course: str) -> list[float | None]:
+        """
+        Return when every grade of a course was given, in the order of its GradeList.
+
+        Args:
+            course (str): The course to look up.
+
+        Returns:
+            list: Seconds since the epoch, None for grades written without grade history.
+        """
+        writes: list[GradeWrite] = self.history(course)
+        given: list[float | None] = [None] * (len(self.get(course, ())) -
+                                               sum(write.count for write in writes))
+        for write in writes:
+            given.extend([write.timestamp] * write.count)
+        return given
+
+    def is_frozen(self, course: str) -> bool:
+        """
+        Return True if the course was completed and its grades are frozen.
+        """
+        records: dict[str, CourseRecord] | None = self._records
+        return records is not None and course in records
+
+    def restore(self, course: str, record: CourseRecord) -> None:
+        """
+        Put back the frozen record of a completed course whose grades were dropped.
+
+        Listeners with a ``restored`` method are told about the record, so indexes built
+        from ratings count the course as they did before its grades were dropped.
+
+        Args:
+            course (str): The completed course.
+            record (CourseRecord): Its final statistics.
+
+        Raises:
+            ValueError: If the course already has grades or statistics.
+        """
+        course = sys.intern(course)
+        locks: ShardedLocks | None = rating_locks
+        if locks is None:
+            self._restore(course, record)
+            self._notify_restored(course, record)
+            return
+        with locks.person(self.owner):
+            self._restore(course, record)
+        with locks.course(course):
+            self._notify_restored(course, record)
+
+    def _restore(self, course: str, record: CourseRecord) -> None:
+        if course in self.course_stats:
+            raise ValueError(f'{course!r} already has grades.')
+        if self._records is None:
+            self._records = {}
+        self._records[course] = record
+        self.grade_count += record.count
+        self.grade_total += record.total
+        if self.owner is not None:
+            self.owner.invalidate_render()
+
+    def _notify_restored(self, course: str, record: CourseRecord) -> None:
+        for listener in rating_listeners:
+            restored = getattr(listener, 'restored', None)
+            if restored is not None:
+                restored(self.owner, course, record)
+
+    def freeze(self, course: str, keep_grades: bool = True) -> CourseRecord | None:
+        """
+        Replace the running aggregate of a course with a frozen CourseRecord.
+
+        Averages over the course and over all courses are unchanged; further grades for
+        the course are refused.
+
+        Args:
+            course (str): The course to freeze.
+            keep_grades (bool): Whether to keep the list of grades; dropping it leaves only
+            the record, which is all averages need.
+
+        Returns:
+            CourseRecord: The record, or None if the course has no grades.
+        """
+        stats: GradeAggregate | CourseRecord | None = self.course_stats.get(course)
+        if stats is None:
+            return None
+        if not isinstance(stats, CourseRecord):
+            if self._records is None:
+                self._records = {}
+            stats = self._records[course] = CourseRecord(
+                stats.count, stats.total, stats.sum_squares, stats.minimum, stats.maximum)
+        if not keep_grades:
+            dict.pop(self, course, None)
+            if self._history is not None:
+                self._history.pop(course, None)
+        return stats
+
+    def _append(self, course: str, grades: list, timestamp: float | list, rater=None) -> None:
+        course_grades: GradeList | Sequence = self.get(course)
+        if course_grades is None:
+            # Only the name stored as a key needs interning
+            course_grades = (GradeList() if grade_storage is None
+                             else grade_storage(self.owner, course))
+            dict.__setitem__(self, sys.intern(course), course_grades)
+        if not grades:
+            return
+        if keep_grade_history or self._history is not None and course in self._history:
+            existing: int = len(course_grades)
+            for run, run_timestamp in grade_runs(grades, timestamp):
+                self._record(course, existing, len(run), run_timestamp, rater)
+                existing += len(run)
+        course_grades._extend(grades)
+        if metrics.active is not None:
+            metrics.active.grade_list_size(len(course_grades))
+        # One update per write from the summary of its grades; a single grade is its own
+        if len(grades) == 1:
+            total = low = high = grades[0]
+            squares = total * total
+        else:
+            total, squares, low, high = _summarize(grades)
+        course_grades.total += total
+        course_grades.sum_squares += squares
+        minimum: int | None = course_grades.minimum
+        if minimum is None:
+            course_grades.minimum, course_grades.maximum = low, high
+        else:
+            if low < minimum:
+                course_grades.minimum = low
+            if high > course_grades.maximum:
+                course_grades.maximum = high
+        self.grade_count += len(grades)
+        self.grade_total += total
+        if self.owner is not None:
+            self.owner.invalidate_render()
+
+    def _record(self, course: str, existing: int, count: int, timestamp: float,
+                rater=None) -> None:
+        if self._history is None:
+            self._history = {}
+        writes: list[GradeWrite] | None = self._history.get(course)
+        if writes is None:
+            # Grades written before history was enabled are kept as one write of unknown time
+            writes = self._history[course] = [GradeWrite(existing, None)] if existing else []
+        if writes and writes[-1].timestamp == timestamp and writes[-1].rater is rater:
+            writes[-1] = writes[-1]._replace(count=writes[-1].count + count)
+        else:
+            writes.append(GradeWrite(count, timestamp, rater))
+
+
+def _rebuild_grade_book(book_type: type, owner, grades: dict[str, list],
+                        history: dict[str, list[GradeWrite]] | None,
+                        records: dict[str, CourseRecord] | None) -> GradeBook:
+    # Unpickle or copy a GradeBook from the state its __reduce__ saved
+    book: GradeBook = book_type(owner)
+    for course, course_grades in grades.items():
+        course_grades = GradeList(course_grades)
+        dict.__setitem__(book, sys.intern(course), course_grades)
+        book.grade_count += len(course_grades)
+        book.grade_total += course_grades.total
+    if records:
+        book._records = {sys.intern(course): record for course, record in records.items()}
+        for course, record in records.items():
+            if course not in grades:
+                book.grade_count += record.count
+                book.grade_total += record.total
+    if history:
+        book._history = {course: list(writes) for course, writes in history.items()}
+    return book
+
+
+def _forget_grade(writes: list[GradeWrite], position: int) -> float | None:
+    # Shrink the write that holds the grade at a position and return when it was given
+    end: int = sum(write.count for write in writes)
+    for index in range(len(writes) - 1, -1, -1):
+        end -= writes[index].count
+        if position >= end:
+            write: GradeWrite = writes[index]
+            if write.count == 1:
+                del writes[index]
+            else:
+                writes[index] = write._replace(count=write.count - 1)
+            return write.timestamp
+    return None
+
+
+class MathMethods:
+    __slots__ = ()
+
+    def average(self, grades) -> float:
+        """
+        Calculate the average grade from a list of grades.
+
+        Args:
+            grades (list): A list of grades for a student, a GradeBook, a GradeAggregate or
+            a CourseRecord.
+
+        Returns:
+            float: The average grade rounded to one decimal place.
+        """
+        recorder: metrics.Metrics | None = metrics.active
+        started: int = time.perf_counter_ns() if recorder is not None else 0
+        if isinstance(grades, GradeBook):
+            result = (round(grades.grade_total / grades.grade_count, 1) if grades.grade_count
+                      else 'Еще нет оценок')
+        elif isinstance(grades, (GradeAggregate, CourseRecord)):
+            result = grades.average()
+        elif not grades:
+            result = 'Еще нет оценок'
+        else:
+            # Lists of lesson grades are summed in place instead of being merged into a copy
+            total: int = 0
+            count: int = 0
+            for item in grades:
+                if isinstance(item, list):
+                    total += sum(item)
+                    count += len(item)
+                else:
+                    total += item
+                    count += 1
+            result = round(total / count, 1) if count else 'Еще нет оценок'
+        if recorder is not None:
+            recorder.observe('average', started)
+        return result
+
+    @property
+    def average_value(self) -> float:
+        """
+        The average grade over all courses, read from the running totals of the GradeBook.
+        """
+        return self.average(self.grades)
+
+    def weighted_average(self, weights) -> float:
+        """
+        Return the average grade over all courses under lesson, course and reviewer weights.
+
+        Args:
+            weights (GradeWeights): The weights to apply.
+
+        Returns:
+            float: The weighted average rounded to one decimal place, or 'Еще нет оценок'.
+        """
+        return weights.person_average(self)
+
+    def invalidate_render(self) -> None:
+        """
+        Forget the cached __str__ output after grades or courses changed.
+        """
+        self._render_cache = None
+
+    @property
+    def ranking_key(self) -> float:
+        """
+        The average grade as a sortable number; people without grades rank last.
+        """
+        average = self.average_value
+        return average if isinstance(average, float) else float('-inf')
+
+    def _comparable(self, other) -> bool:
+        return isinstance(other, type(self)) or isinstance(self, type(other))
+
+    def __eq__(self, other) -> bool:
+        if not self._comparable(other):
+            return NotImplemented
+        return self.ranking_key == other.ranking_key
+
+    def __lt__(self, other) -> bool:
+        if not self._comparable(other):
+            return NotImplemented
+        return self.ranking_key < other.ranking_key
+
+    def __le__(self, other) -> bool:
+        if not self._comparable(other):
+            return NotImplemented
+        return self.ranking_key <= other.ranking_key
+
+    def __gt__(self, other) -> bool:
+        if not self._comparable(other):
+            return NotImplemented
+        return self.ranking_key > other.ranking_key
+
+    def __ge__(self, other) -> bool:
+        if not self._comparable(other):
+            return NotImplemented
+        return self.ranking_key >= other.ranking_key
+
+
+# Reasons a rating is rejected
+WRONG_TYPE: str = 'wrong type'
+COURSE_NOT_ATTACHED: str = 'course not attached'
+COURSE_NOT_IN_PROGRESS: str = 'course not in progress'
+COURSE_COMPLETED: str = 'course completed'
+
+
+class RatingError(NamedTuple):
+    """
+    A rejected row of a batch rating call.
+
+    Attributes:
+        row (int): The zero-based position of the row in the batch.
+        person (Student | Lecturer): The person the row tried to rate.
+        course (str): The course of the row.
+        reason (str): Why the row was rejected.
+    """
+    row: int
+    person: object
+    course: str
+    reason: str
+
+
+def rate_in_bulk(rows: Iterable[tuple], rejection_reason, timestamp: float = None,
+                 rater=None) -> list[RatingError]:
+    """
+    Validate and apply (person, course, grades[, timestamp]) rows in bulk.
+
+    Permissions are checked once per distinct (person, course) pair and all accepted grades
+    of a pair are appended with a single GradeBook write, which carries one timestamp per
+    grade when the rows were given at different times.
+
+    Args:
+        rows (Iterable): Tuples of (person, course, grades), grades being a list, with an
+        optional fourth item saying when the grades were given.
+        rejection_reason (callable): Returns the reason a (person, course) pair may not be
+        rated, or None if it may; it must refuse completed courses, which are not checked
+        again.
+        timestamp (float): When the grades of rows without a timestamp (or with None) were
+        given, as seconds since the epoch; defaults to now.
+        rater: Who gave the grades of all rows, recorded with every write.
+
+    Returns:
+        list: A RatingError for every rejected row.
+    """
+    timestamp = time.time() if timestamp is None else timestamp
+    errors: list[RatingError] = []
+    reasons: dict[tuple, str | None] = {}
+    pending: dict[tuple, list] = {}
+    for row, (person, course, grades, *given_at) in enumerate(rows):
+        key: tuple = (id(person), course)
+        if key not in reasons:
+            reasons[key] = rejection_reason(person, course)
+        if reasons[key] is not None:
+            errors.append(RatingError(row, person, course, reasons[key]))
+            continue
+        row_timestamp: float = given_at[0] if given_at and given_at[0] is not None else timestamp
+        write: list | None = pending.get(key)
+        if write is None:
+            pending[key] = [person, course, list(grades), row_timestamp]
+            continue
+        # The times stay a single float until a row of the pair was given at another time
+        times: float | list = write[3]
+        if not isinstance(times, list) and times != row_timestamp:
+            times = write[3] = [times] * len(write[2])
+        if isinstance(times, list):
+            times.extend([row_timestamp] * len(grades))
+        write[2].extend(grades)
+    for person, course, grades, times in pending.values():
+        person.grades._write(course, grades, times, rater)
+    if metrics.active is not None:
+        for error in errors:
+            metrics.active.reject('rate_in_bulk', error.reason)
+    return errors
+
+
+# Student's Class
+class Student(PersonalInfo, MathMethods):
+    """
+    A class to represent a student with personal information, grades, courses in progress,
+    and finished courses.
+
+    Attributes:
+        name (str): The first name of the student.
+        surname (str): The last name of the student.
+        gender (str): The gender of the student.
+        finished_courses (CourseSet): Courses finished by the student.
+        courses_in_progress (CourseSet): Courses currently in progress for the student.
+        grades (GradeBook): Dictionary containing grades for different courses.
+        average_value (float): The average grade of the student.
+
+    Methods:
+        __str__(self) -> str: Return a formatted string with the student's personal information,
+        average grade, courses in progress, and finished courses.
+        __gt__(self, second) -> bool: Compare the average grades of two students and return True
+        if the current student has a higher average grade.
+        __eq__(self, second) -> bool: Compare the average grades of two students and return True
+        if they are equal.
+        compare_summary(self, other) -> str: Describe which of two students is more successful.
+        equality_summary(self, other) -> str: Describe whether two students are equally
+        successful.
+        rate_lecturer(self, lecturer, course, grade) -> dict: Rate a lecturer for a specific
+        course and update the lecturer's grades dictionary.
+    """
+
+    __slots__ = ('_finished_courses', '_courses_in_progress', 'grades', '_render_cache')
+
+    def __init__(self, name: str, surname: str, gender: str):
+        super().__init__(name, surname, gender)
+        self._render_cache: str | None = None
+        # The courses are stored compactly and read through CourseSet views
+        self._finished_courses: tuple | dict | None = None
+        self._courses_in_progress: tuple | dict | None = None
+        self.grades: GradeBook = GradeBook(self)
+
+    @property
+    def finished_courses(self) -> CourseSet:
+        return CourseSet(owner=self, attribute='finished_courses')
+
+    @finished_courses.setter
+    def finished_courses(self, courses: Iterable[str]) -> None:
+        if _replace_courses(self, 'finished_courses', courses):
+            self.invalidate_render()
+
+    @property
+    def courses_in_progress(self) -> CourseSet:
+        return CourseSet(owner=self, attribute='courses_in_progress')
+
+    @courses_in_progress.setter
+    def courses_in_progress(self, courses: Iterable[str]) -> None:
+        if _replace_courses(self, 'courses_in_progress', courses):
+            self.invalidate_render()
+
+    def complete_course(self, course: str, keep_grades: bool = True,
+                        archive=None) -> CourseRecord | None:
+        """
+        Move a course from the courses in progress to the finished courses and freeze it.
+
+        The final aggregate of the course becomes a CourseRecord, so the student's averages
+        stay the same while the list of grades can be archived and dropped. Dropped grades
+        are no longer saved by save_model or seen by load() methods.
+
+        Parameters:
+            course (str): The course to complete.
+            keep_grades (bool): Whether to keep the list of grades of the course.
+            archive (callable): Called as archive(student, course, grades) before the
+            grades are dropped or kept.
+
+        Returns:
+            CourseRecord: The final statistics, or None if the course has no grades.
+
+        Raises:
+            ValueError: If the course is not in progress.
+        """
+        if course not in self.courses_in_progress:
+            raise ValueError(f'{course!r} is not in progress for {self.fullname}.')
+        if archive is not None and course in self.grades:
+            archive(self, course, self.grades[course])
+        record: CourseRecord | None = self.grades.freeze(course, keep_grades)
+        self.courses_in_progress.discard(course)
+        self.finished_courses.add(course)
+        return record
+
+    def __str__(self) -> str:
+        """
+        Return a formatted string with the student's personal information,
+        average grade, courses in progress, and finished courses.
+
+        The result is cached until the grades or courses of the student change.
+
+        Returns:
+            str: A formatted string containing the student's personal information,
+            average grade, courses in progress, and finished courses.
+        """
+        recorder: metrics.Metrics | None = metrics.active
+        started: int = time.perf_counter_ns() if recorder is not None else 0
+        if self._render_cache is None:
+            name: str = f'Имя: {self.name}'
+            surname: str = f'Фамилия: {self.surname}'
+            average_rate: str = f'Средняя оценка за лекции: {self.average_value}'
+            courses_in_progress: str = (f'Курсы в процессе изучен'
+                                       f'ия: {', '.join(self.courses_in_progress)}')
+            courses_finished: str = f'Завершенные курсы: {', '.join(self.finished_courses)}'
+            self._render_cache = (f'{name}\n{surname}\n{average_rate}\n{courses_in_progress}\n'
+                                  f'{courses_finished}')
+            if recorder is not None:
+                recorder.count('str_cache_miss')
+        if recorder is not None:
+            recorder.observe('str', started)
+        return self._render_cache
+
+    def compare_summary(self, other) -> str:
+        """
+        Compare the average grades of two students and determine which student has
+        a higher average grade.
+
+        Parameters:
+            other (Student): The other student to compare the average grade with.
+
+        Returns:
+            str: A formatted string indicating which student has a higher average grade
+            and by how much.
+
+        Raises:
+            ValueError: If the average grades are not calculated properly or if the comparison
+            is not between two Student instances.
+        """
+        if None in (self.average_value, other.average_value):
+            raise ValueError('Average grades are not calculated properly.')
+        if not isinstance(other, Student):
+            raise ValueError('Comparison can only be done between two Student instances.')
+
+        self_more: str = (f'{self.fullname}({self.average_value}) результативнее '
+                          f'{other.fullname}({other.average_value})')
+        second_more: str = (f'{other.fullname}({other.average_value}) результативнее '
+                            f'{self.fullname}({self.average_value}).')
+
+        return self_more if self.average_value > other.average_value else second_more
+
+    def equality_summary(self, other) -> str:
+        """
+        Compare the average grades of two students and determine if they are equal.
+
+        Parameters:
+            other (Student): The other student to compare the average grade with.
+
+        Returns:
+            str: A formatted string indicating whether the students have equal average grades
+            and providing details on their names and average grades.
+
+        Raises:
+            ValueError: If the average grades are not calculated properly or if the comparison
+            is not between two Student instances.
+        """
+        if None in (self.average_value, other.average_value):
+            raise ValueError('Average grades are not calculated properly.')
+        if not isinstance(other, Student):
+            raise ValueError('Comparison can only be done between two Student instances.')
+
+        equality: str = (f'{self.fullname} и {other.fullname} одинаково результативны. Их средняя '
+                         f'оценка за лекции составляет: {self.average_value}')
+        inequality: str = (f'{self.fullname}({self.average_value}) и {other.fullname}'
+                           f'({other.average_value}) не одинаково результативны.')
+
+        return equality if self.average_value == other.average_value else inequality
+
+    def rate_lecturer(self, lecturer, course: str, grade: int, timestamp: float = None):
+        """
+        Rate a lecturer for a particular course.
+
+        Parameters:
+            lecturer (Lecturer): The lecturer to be rated.
+            course (str): The course for which the lecturer is being rated.
+            grade (int): The grade given to the lecturer for the course.
+            timestamp (float): When the grade was given (seconds since the epoch); now
+            by default.
+
+        Returns:
+            str: If the rating is successful, returns None. If the conditions for rating
+            are not met, returns 'Ошибка'.
+        """
+        recorder: metrics.Metrics | None = metrics.active
+        started: int = time.perf_counter_ns() if recorder is not None else 0
+        reason: str | None = self.lecturer_rejection_reason(lecturer, course)
+        if reason is None:
+            lecturer.grades._write(course, [grade], timestamp, self)
+        if recorder is not None:
+            recorder.rated('rate_lecturer', reason, started)
+        if reason is not None:
+            return 'Ошибка'
+
+    def lecturer_rejection_reason(self, lecturer, course: str) -> str | None:
+        """
+        Explain why this student may not rate a lecturer for a course.
+
+        Parameters:
+            lecturer (Lecturer): The lecturer to be rated.
+            course (str): The course for which the lecturer is being rated.
+
+        Returns:
+            str: The rejection reason, or None if the rating is allowed.
+        """
+        if not isinstance(lecturer, Lecturer):
+            return WRONG_TYPE
+        # The stored courses are read directly instead of through CourseSet views
+        attached: tuple | dict | None = lecturer._courses_attached
+        if attached is None or course not in attached:
+            return COURSE_NOT_ATTACHED
+        in_progress: tuple | dict | None = self._courses_in_progress
+        if in_progress is None or course not in in_progress:
+            return COURSE_NOT_IN_PROGRESS
+        if lecturer.grades.is_frozen(course):
+            return COURSE_COMPLETED
+        return None
+
+    def rate_lecturers_batch(self, rows: Iterable[tuple],
+                             timestamp: float = None) -> list[RatingError]:
+        """
+        Rate many lecturers at once.
+
+        Parameters:
+            rows (Iterable): Tuples of (lecturer, course, grade[, timestamp]).
+            timestamp (float): When rows without a timestamp were given; defaults to now.
+
+        Returns:
+            list: A RatingError for every rejected row; empty if all rows were applied.
+        """
+        return rate_in_bulk(((lecturer, course, [grade], *given_at)
+                             for lecturer, course, grade, *given_at in rows),
+                            self.lecturer_rejection_reason, timestamp, self)
+
+
+# Parent class
+class Mentor(PersonalInfo):
+    __slots__ = ('_courses_attached',)
+
+    def __init__(self, name: str, surname: str, gender: str):
+        super().__init__(name, surname, gender)
+        self._courses_attached: tuple | dict | None = None
+
+    @property
+    def courses_attached(self) -> CourseSet:
+        return CourseSet(owner=self, attribute='courses_attached')
+
+    @courses_attached.setter
+    def courses_attached(self, courses: Iterable[str]) -> None:
+        _replace_courses(self, 'courses_attached', courses)
+
+
+# Lecturers class
+class Lecturer(Mentor, MathMethods):
+    __slots__ = ('grades', '_render_cache')
+
+    def __init__(self, name: str, surname: str, gender: str):
+        super().__init__(name, surname, gender)
+        self._render_cache: str | None = None
+        self.grades: GradeBook = GradeBook(self)
+
+    def __str__(self) -> str:
+        """
+        Return a formatted string with the student's personal information,
+        average grade, courses in progress, and finished courses.
+
+        The result is cached until the lecturer receives new grades.
+
+        Returns:
+            str: A formatted string containing the student's personal information,
+            average grade, courses in progress, and finished courses.
+        """
+        recorder: metrics.Metrics | None = metrics.active
+        started: int = time.perf_counter_ns() if recorder is not None else 0
+        if self._render_cache is None:
+            self._render_cache = (f'Имя: {self.name}\nФамилия: {self.surname}\n'
+                                  f'Средняя оценка за лекции: {self.average_value}')
+            if recorder is not None:
+                recorder.count('str_cache_miss')
+        if recorder is not None:
+            recorder.observe('str', started)
+        return self._render_cache
+
+    def compare_summary(self, other) -> str:
+        """
+        Compare the average grades of two lecturers and determine which lecturer has
+        a higher average grade.
+
+        Parameters:
+            other (Lecturer): The other lecturer to compare the average grade with.
+
+        Returns:
+            str: A formatted string indicating which lecturer has a higher average grade
+            and by how much.
+
+        Raises:
+            ValueError: If the average grades are not calculated properly or if the comparison
+            is not between two Lecturer instances.
+        """
+        if None in (self.average_value, other.average_value):
+            raise ValueError('Average grades are not calculated properly.')
+        if not isinstance(other, Lecturer):
+            raise ValueError('Comparison can only be done between two Student instances.')
+
+        self_more: str = (f'{self.fullname}({self.average_value}) результативнее {other.fullname}'
+					 f'({other.average_value})')
+        second_more: str = (f'{other.fullname}({other.average_value}) результативне'
+                            f'е {self.fullname}'
+					   f'({self.average_value}).')
+
+        return self_more if self.average_value > other.average_value else second_more
+
+    def equality_summary(self, other) -> str:
+        """
+        Compare the average grades of two students and determine if they are equal.
+
+        Parameters:
+            other (Lecturer): The other lecturer to compare the average grade with.
+
+        Returns:
+            str: A formatted string indicating whether the lecturers have equal average grades
+            and providing details on their names and average grades.
+
+        Raises:
+            ValueError: If the average grades are not calculated properly or if the comparison
+            is not between two Lecturer instances.
+        """
+        if None in (self.average_value, other.average_value):
+            raise ValueError('Average grades are not calculated properly.')
+        if not isinstance(other, Lecturer):
+            raise ValueError('Comparison can only be done between two Student instances.')
+
+        equality: str = (f'{self.fullname} и {other.fullname} одинаково результативны. Их средняя '
+					f'оценка за лекции составляет: {self.average_value}')
+        inequality: str = (f'{self.fullname}({self.average_value}) и {other.fullname}'
+					  f'({other.average_value}) не одинаково результативны.')
+
+        return equality if self.average_value == other.average_value else inequality
+
+
+# Reviewers class
+class Reviewer(Mentor):
+    __slots__ = ()
+
+    def rate_student(self, student, course: str, grade: list, timestamp: float = None):
+        """
+        Rate a student for a specific course.
+
+        Parameters:
+            student (Student): The student to be rated.
+            course (str): The course for which the student is being rated.
+            grade (list): Ratings inside the list.
+            timestamp (float): When the grades were given (seconds since the epoch); now
+            by default.
+
+        Returns:
+            str: If the rating is successful, returns None. If the conditions for rating
+            are not met, returns 'Ошибка'.
+        """
+        recorder: metrics.Metrics | None = metrics.active
+        started: int = time.perf_counter_ns() if recorder is not None else 0
+        reason: str | None = self.student_rejection_reason(student, course)
+        if reason is None:
+            student.grades._write(course, grade, timestamp, self)
+        if recorder is not None:
+            recorder.rated('rate_student', reason, started)
+        if reason is not None:
+            return 'Ошибка'
+
+    def student_rejection_reason(self, student, course: str) -> str | None:
+        """
+        Explain why this reviewer may not rate a student for a course.
+
+        Parameters:
+            student (Student): The student to be rated.
+            course (str): The course for which the student is being rated.
+
+        Returns:
+            str: The rejection reason, or None if the rating is allowed.
+        """
+        if not isinstance(student, Student):
+            return WRONG_TYPE
+        # The stored courses are read directly instead of through CourseSet views
+        in_progress: tuple | dict | None = student._courses_in_progress
+        if in_progress is None or course not in in_progress:
+            return COURSE_NOT_IN_PROGRESS
+        attached: tuple | dict | None = self._courses_attached
+        if attached is None or course not in attached:
+            return COURSE_NOT_ATTACHED
+        if student.grades.is_frozen(course):
+            return COURSE_COMPLETED
+        return None
+
+    def rate_students_batch(self, rows: Iterable[tuple],
+                            timestamp: float = None) -> list[RatingError]:
+        """
+        Rate many students at once.
+
+        Parameters:
+            rows (Iterable): Tuples of (student, course, grades[, timestamp]), grades being
+            a list.
+            timestamp (float): When rows without a timestamp were given; defaults to now.
+
+        Returns:
+            list: A RatingError for every rejected row; empty if all rows were applied.
+        """
+        return rate_in_bulk(rows, self.student_rejection_reason, timestamp, self)
+
+    def __str__(self) -> str:
+        """
+        Returns a string with the reviewer's first and last name.
+        """
+        return f'Имя: {self.name}\nФамилия: {self.surname}'
+
+
+def rate_rows(rater, rows: list[tuple], timestamp: float = None) -> list[RatingError]:
+    """
+    Apply (person, course, grades[, timestamp]) rows given by one rater through the batch
+    methods.
+
+    A Reviewer rates students and a Student rates lecturers; rows from any other rater
+    are all rejected.
+
+    Parameters:
+        rater (Reviewer | Student): Who gives the grades.
+        rows (list): Tuples of (person, course, grades), grades being a list, with an
+        optional timestamp.
+        timestamp (float): When rows without a timestamp were given; defaults to now.
+
+    Returns:
+        list: A RatingError for every rejected row.
+    """
+    if isinstance(rater, Reviewer):
+        return rater.rate_students_batch(rows, timestamp)
+    if isinstance(rater, Student):
+        return rate_in_bulk(rows, rater.lecturer_rejection_reason, timestamp, rater)
+    return [RatingError(row, person, course, WRONG_TYPE)
+            for row, (person, course, *_) in enumerate(rows)]
+
+
+# Base class for subsystems fed by GradeBook writes
+class RatingListener(ABC):
+    """
+    A callable that can subscribe itself to rating_listeners.
+
+    Subclasses must implement ``__call__(owner, course, grades, timestamp)``; a subclass
+    that does not cannot be instantiated.
+    """
+
+    def attach(self):
+        """
+        Start receiving every rating written through a GradeBook.
+
+        Returns:
+            RatingListener: The listener itself.
+        """
+        if not any(listener is self for listener in rating_listeners):
+            rating_listeners.append(self)
+        return self
+
+    def detach(self) -> None:
+        """
+        Stop receiving ratings.
+        """
+        rating_listeners[:] = [listener for listener in rating_listeners if listener is not self]
+
+    @abstractmethod
+    def __call__(self, owner, course: str, grades: list, timestamp: float | list) -> None:
+        """
+        Called after grades were added to a GradeBook; timestamp is one time for all the
+        grades or a list with one time per grade, see grade_runs.
+        """
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Called after grades given at given_at were removed from a GradeBook; ignored unless
+        overridden.
+        """
+
+    def restored(self, owner, course: str, record: CourseRecord) -> None:
+        """
+        Called after GradeBook.restore put back the record of a completed course; ignored
+        unless overridden.
+        """
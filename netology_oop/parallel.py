@@ -0,0 +1,109 @@
+# Course totals and averages over many grade dictionaries, computed in worker processes
+import multiprocessing
+import os
+from collections.abc import Iterable
+
+from netology_oop.model import GradeBook
+
+# The plain dictionaries forked workers read by index range; set only while a pool runs
+_population: list[dict] = []
+
+
+# Multiprocess aggregation
+def _partial_course_totals(shard: list[dict],
+                           course_name: str = None) -> dict[str, tuple[int, int]]:
+    totals: dict[str, list[int]] = {}
+    for grades in shard:
+        courses: Iterable[str] = grades if course_name is None else (
+            (course_name,) if course_name in grades else ())
+        for course in courses:
+            course_grades: list = grades[course]
+            course_totals: list = totals.setdefault(course, [0, 0])
+            course_totals[0] += sum(course_grades)
+            course_totals[1] += len(course_grades)
+    return {course: (total, count) for course, (total, count) in totals.items()}
+
+
+def _range_course_totals(task: tuple[int, int, str | None]) -> dict[str, tuple[int, int]]:
+    start, end, course_name = task
+    return _partial_course_totals(_population[start:end], course_name)
+
+
+def _shard_course_totals(task: tuple[list[dict], str | None]) -> dict[str, tuple[int, int]]:
+    return _partial_course_totals(*task)
+
+
+def parallel_course_totals(role: list[dict], processes: int = None, shard_size: int = None,
+                           course_name: str = None) -> dict[str, tuple[int, int]]:
+    """
+    Compute (sum, count) of grades per course, summing plain dictionaries in a process pool.
+
+    GradeBooks already hold a running (or, for completed courses, frozen) aggregate per
+    course, so they are merged in the parent without reading or copying a grade. Only plain
+    dictionaries are summed by workers: where processes can be forked, the workers inherit
+    the dictionaries and receive index ranges; elsewhere shards of them are pickled.
+
+    Args:
+        role (list): Grade dictionaries of students or lecturers.
+        processes (int): The number of worker processes; defaults to the CPU count.
+        shard_size (int): Dictionaries per task; defaults to an even split over the workers.
+        course_name (str): Only total this course.
+
+    Returns:
+        dict: (sum, count) for every course.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    merged: dict[str, list[int]] = {}
+    plain: list[dict] = []
+    for grades in role:
+        if not isinstance(grades, GradeBook):
+            plain.append(grades)
+            continue
+        for course, stats in grades.course_stats.items():
+            if course_name is None or course == course_name:
+                course_totals: list = merged.setdefault(course, [0, 0])
+                course_totals[0] += stats.total
+                course_totals[1] += stats.count
+
+    if plain:
+        global _population
+        processes = processes or os.cpu_count() or 1
+        shard_size = shard_size or max(1, -(-len(plain) // (processes * 4)))
+        starts: range = range(0, len(plain), shard_size)
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            worker = _range_course_totals
+            tasks: Iterable = ((start, start + shard_size, course_name) for start in starts)
+            _population = plain
+        else:
+            context = None
+            worker = _shard_course_totals
+            tasks = ((plain[start:start + shard_size], course_name) for start in starts)
+        try:
+            with ProcessPoolExecutor(processes, mp_context=context) as pool:
+                for partial in pool.map(worker, tasks):
+                    for course, (total, count) in partial.items():
+                        course_totals = merged.setdefault(course, [0, 0])
+                        course_totals[0] += total
+                        course_totals[1] += count
+        finally:
+            _population = []
+    return {course: (total, count) for course, (total, count) in merged.items()}
+
+
+def parallel_average_rating(course_name: str, role: list[dict], processes: int = None) -> float:
+    """
+    Calculate the average rating for a course like average_rating, using a process pool.
+
+    Args:
+        course_name (str): The name of the course to calculate the average rating for.
+        role (list): A list of dictionaries containing ratings for different courses.
+        processes (int): The number of worker processes; defaults to the CPU count.
+
+    Returns:
+        float: The average rating rounded to one decimal place.
+    """
+    total, count = parallel_course_totals(role, processes,
+                                          course_name=course_name).get(course_name, (0, 0))
+    return round(total / count, 1) if count else 'Еще нет оценок'
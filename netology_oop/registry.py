@@ -0,0 +1,234 @@
+# A central registry: dense integer ids, a full name index and course reverse indexes
+import sys
+from collections.abc import Iterable
+
+from netology_oop.model import Lecturer, Reviewer, Student, enrollment_listeners, rename_listeners
+
+# The kinds of people the registry numbers, in the order they are checked
+KINDS: dict[type, str] = {Student: 'students', Lecturer: 'lecturers', Reviewer: 'reviewers'}
+
+# (kind of person, course attribute) -> the reverse index the courses are kept in
+INDEXES: dict[tuple[str, str], str] = {
+    ('students', 'courses_in_progress'): 'students',
+    ('students', 'finished_courses'): 'graduates',
+    ('lecturers', 'courses_attached'): 'lecturers',
+    ('reviewers', 'courses_attached'): 'reviewers',
+}
+
+
+class Registry:
+    """
+    Every student, lecturer, reviewer and course, numbered from zero by kind.
+
+    People are looked up by id through a dictionary keyed by id(person) (the model classes
+    define __eq__, so they are not hashable), by full name through a hash index and by course
+    through reverse indexes, so none of the lookups scans the registered objects. A course
+    name is numbered the first time it is indexed.
+
+    There are four reverse indexes per course: students taking it, students who finished
+    it, attached lecturers and attached reviewers. An attached registry listens to
+    enrollment_listeners and moves a person between them on every CourseSet change, so
+    course-scoped queries only touch the people involved. It also listens to
+    rename_listeners and moves a renamed person to its new full name.
+
+    Attributes:
+        students (list): Registered students, indexed by their id.
+        lecturers (list): Registered lecturers, indexed by their id.
+        reviewers (list): Registered reviewers, indexed by their id.
+        courses (list): Course names, indexed by their id.
+    """
+
+    def __init__(self):
+        self.students: list[Student] = []
+        self.lecturers: list[Lecturer] = []
+        self.reviewers: list[Reviewer] = []
+        self.courses: list[str] = []
+        self._course_ids: dict[str, int] = {}
+        # id(person) -> (kind, dense id)
+        self._ids: dict[int, tuple[str, int]] = {}
+        self._by_fullname: dict[str, list] = {}
+        # id(person) -> (the full name the person is indexed under, registration number)
+        self._fullnames: dict[int, tuple[str, int]] = {}
+        # index -> course id -> {person id: None}, ordered by registration
+        self._members: dict[str, dict[int, dict[int, None]]] = {
+            index: {} for index in INDEXES.values()}
+
+    def attach(self) -> 'Registry':
+        """
+        Start following course changes and renames of registered people.
+
+        Returns:
+            Registry: The registry itself.
+        """
+        if self.course_changed not in enrollment_listeners:
+            enrollment_listeners.append(self.course_changed)
+        if self.renamed not in rename_listeners:
+            rename_listeners.append(self.renamed)
+        return self
+
+    def detach(self) -> None:
+        """
+        Stop following course changes and renames; the indexes keep their current state.
+        """
+        enrollment_listeners[:] = [listener for listener in enrollment_listeners
+                                   if listener != self.course_changed]
+        rename_listeners[:] = [listener for listener in rename_listeners
+                               if listener != self.renamed]
+
+    @staticmethod
+    def kind(person) -> str:
+        """
+        Return 'students', 'lecturers' or 'reviewers' for a person.
+
+        Raises:
+            TypeError: If the person is none of these.
+        """
+        for cls, kind in KINDS.items():
+            if isinstance(person, cls):
+                return kind
+        raise TypeError(f'Cannot register {type(person).__name__} objects.')
+
+    def course_id(self, course: str) -> int:
+        """
+        Return the id of a course, assigning a new one on first use.
+        """
+        course_id: int | None = self._course_ids.get(course)
+        if course_id is None:
+            course_id = self._course_ids[sys.intern(course)] = len(self.courses)
+            self.courses.append(course)
+        return course_id
+
+    def register(self, person) -> int:
+        """
+        Number a person and add it to the full name and course indexes.
+
+        Registering the same person again returns the id it already has.
+
+        Args:
+            person (Student | Lecturer | Reviewer): The person to register.
+
+        Returns:
+            int: The id of the person among people of its kind.
+        """
+        known: tuple[str, int] | None = self._ids.get(id(person))
+        if known is not None:
+            return known[1]
+        kind: str = self.kind(person)
+        people: list = getattr(self, kind)
+        person_id: int = len(people)
+        people.append(person)
+        self._ids[id(person)] = (kind, person_id)
+        self._by_fullname.setdefault(person.fullname, []).append(person)
+        self._fullnames[id(person)] = (person.fullname, len(self._fullnames))
+        for (index_kind, attribute), index in INDEXES.items():
+            if index_kind == kind:
+                for course in getattr(person, attribute):
+                    self._members[index].setdefault(self.course_id(course), {})[person_id] = None
+        return person_id
+
+    def register_all(self, people: Iterable) -> 'Registry':
+        """
+        Register every person of an iterable.
+
+        Returns:
+            Registry: The registry itself.
+        """
+        for person in people:
+            self.register(person)
+        return self
+
+    def course_changed(self, owner, attribute: str, course: str, added: bool) -> None:
+        """
+        Move a registered person in or out of a reverse index after a CourseSet change.
+        """
+        known: tuple[str, int] | None = self._ids.get(id(owner))
+        if known is None:
+            return
+        kind, person_id = known
+        index: str | None = INDEXES.get((kind, attribute))
+        if index is None:
+            return
+        members: dict[int, dict[int, None]] = self._members[index]
+        if added:
+            members.setdefault(self.course_id(course), {})[person_id] = None
+        elif course in self._course_ids:
+            members.get(self._course_ids[course], {}).pop(person_id, None)
+
+    def renamed(self, person) -> None:
+        """
+        Move a registered person to its new full name after a rename.
+
+        The person keeps its place among the people of its new name by registration order.
+        """
+        known: tuple[str, int] | None = self._fullnames.get(id(person))
+        if known is None or known[0] == person.fullname:
+            return
+        old, number = known
+        namesakes: list = self._by_fullname[old]
+        namesakes[:] = [namesake for namesake in namesakes if namesake is not person]
+        if not namesakes:
+            del self._by_fullname[old]
+        self._fullnames[id(person)] = (person.fullname, number)
+        namesakes = self._by_fullname.setdefault(person.fullname, [])
+        position: int = len(namesakes)
+        while position and self._fullnames[id(namesakes[position - 1])][1] > number:
+            position -= 1
+        namesakes.insert(position, person)
+
+    def id_of(self, person) -> int:
+        """
+        Return the id of a registered person.
+
+        Raises:
+            KeyError: If the person is not registered.
+        """
+        return self._ids[id(person)][1]
+
+    def get(self, kind: str, person_id: int):
+        """
+        Return the person of a kind with an id.
+        """
+        return getattr(self, kind)[person_id]
+
+    def find(self, fullname: str) -> list:
+        """
+        Return the registered people with a full name, in registration order.
+        """
+        return list(self._by_fullname.get(fullname, ()))
+
+    def members(self, course: str, index: str = 'students') -> list:
+        """
+        Return the people of a reverse index of a course, in registration order.
+
+        Args:
+            course (str): The course to look up.
+            index (str): 'students' taking the course, 'graduates' who finished it, or the
+            'lecturers' or 'reviewers' attached to it.
+
+        Returns:
+            list: The people in the index.
+        """
+        if index not in self._members:
+            raise ValueError("Index must be 'students', 'graduates', 'lecturers' or "
+                             "'reviewers'.")
+        course_id: int | None = self._course_ids.get(course)
+        if course_id is None:
+            return []
+        people: list = self.students if index == 'graduates' else getattr(self, index)
+        return [people[person_id] for person_id in self._members[index].get(course_id, ())]
+
+    def grade_books(self, course: str, role: str = 'students') -> list:
+        """
+        Return the GradeBooks average_rating needs for a course, from the reverse indexes.
+
+        Args:
+            course (str): The course to look up.
+            role (str): 'students' (taking or finished the course) or 'lecturers'.
+
+        Returns:
+            list: The grades of the people involved in the course.
+        """
+        if role not in ('students', 'lecturers'):
+            raise ValueError("Role must be either 'students' or 'lecturers'.")
+        indexes: tuple[str, ...] = ('students', 'graduates') if role == 'students' else (role,)
+        return [person.grades for index in indexes for person in self.members(course, index)]
@@ -0,0 +1,106 @@
+# Bulk reports over many people: text, CSV and JSON renderings and course averages
+import csv
+import io
+import json
+import sys
+from collections.abc import Iterable
+
+from netology_oop.model import GradeAggregate, Lecturer, Student
+
+
+# Bulk reports
+REPORT_TITLES: dict[str, str] = {'Student': 'Студент', 'Lecturer': 'Лектор',
+                                 'Reviewer': 'Проверяющий'}
+REPORT_FIELDS: tuple = ('record', 'role', 'name', 'surname', 'average', 'courses',
+                        'finished_courses')
+
+
+def _report_record(person) -> dict:
+    record: dict = {'record': 'person', 'role': type(person).__name__, 'name': person.name,
+                    'surname': person.surname, 'average': getattr(person, 'average_value', None)}
+    if isinstance(person, Student):
+        record['courses'] = list(person.courses_in_progress)
+        record['finished_courses'] = list(person.finished_courses)
+    else:
+        record['courses'] = list(person.courses_attached)
+        record['finished_courses'] = []
+    return record
+
+
+def write_report(people: Iterable, output=None, file_format: str = 'text',
+                 flush_every: int = 1000) -> int:
+    """
+    Write the summary of every person and the per-course averages in one streamed pass.
+
+    People are rendered with their cached __str__ (or the equivalent record for CSV and
+    JSON) and written in blocks of flush_every people. Per-course averages are collected
+    during the same pass and written at the end, like the TASK 4 tables.
+
+    Args:
+        people (Iterable): Students, lecturers and reviewers.
+        output: A path, a writable text file, or None for stdout.
+        file_format (str): 'text', 'csv' or 'json'.
+        flush_every (int): The number of people buffered before each write.
+
+    Returns:
+        int: The number of people written.
+    """
+    if file_format not in ('text', 'csv', 'json'):
+        raise ValueError("File format must be one of 'text', 'csv' or 'json'.")
+    if isinstance(output, str):
+        with open(output, 'w', encoding='utf-8', newline='', buffering=1 << 16) as file:
+            return write_report(people, file, file_format, flush_every)
+    output = sys.stdout if output is None else output
+
+    tables: dict[str, dict[str, GradeAggregate]] = {'students': {}, 'lecturers': {}}
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.DictWriter(buffer, REPORT_FIELDS) if file_format == 'csv' else None
+    if writer is not None:
+        writer.writeheader()
+    elif file_format == 'json':
+        buffer.write('{"people": [')
+
+    written: int = 0
+    for person in people:
+        if isinstance(person, (Student, Lecturer)):
+            table: dict = tables['students' if isinstance(person, Student) else 'lecturers']
+            for course, stats in person.grades.course_stats.items():
+                table.setdefault(course, GradeAggregate()).merge(stats)
+
+        if file_format == 'text':
+            buffer.write(f'— {REPORT_TITLES[type(person).__name__]} —\n{person}\n\n')
+        elif file_format == 'csv':
+            record: dict = _report_record(person)
+            record['courses'] = ', '.join(record['courses'])
+            record['finished_courses'] = ', '.join(record['finished_courses'])
+            writer.writerow(record)
+        else:
+            buffer.write((', ' if written else '') + json.dumps(_report_record(person),
+                                                                ensure_ascii=False))
+        written += 1
+        if written % flush_every == 0:
+            output.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+    averages: dict[str, dict] = {role: {course: stats.average() for course, stats in table.items()}
+                                 for role, table in tables.items()}
+    if file_format == 'text':
+        titles: dict[str, str] = {
+            'students': ('Средняя оценка за домашние задания '
+                         'по всем студентам в рамках '
+                         'конкретного курса:'),
+            'lecturers': ('Средняя оценка за лекции всех '
+                          'лекторов в рамках конкретного курса:')}
+        for role, table in averages.items():
+            buffer.write(titles[role] + '\n')
+            buffer.writelines(f'{course}: {average}\n' for course, average in table.items())
+    elif file_format == 'csv':
+        for role, table in averages.items():
+            for course, average in table.items():
+                writer.writerow({'record': 'course', 'role': role, 'name': course,
+                                 'average': average})
+    else:
+        buffer.write(f'], "courses": {json.dumps(averages, ensure_ascii=False)}}}\n')
+    output.write(buffer.getvalue())
+    return written
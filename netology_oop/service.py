@@ -0,0 +1,142 @@
+# An asyncio front end that queues ratings and writes them in batches
+import asyncio
+import time
+
+from netology_oop.model import Lecturer, Reviewer, Student, rate_rows
+from netology_oop.stats import course_index
+
+
+# Asynchronous rating service
+class AsyncRatingService:
+    """
+    An asyncio front end that coalesces many small ratings into batch writes.
+
+    Submissions are queued and a background task drains the queue, grouping up to
+    batch_size ratings by rater and applying them through the batch rating methods. The
+    queue is bounded by max_pending, so submitters wait when the writer falls behind.
+
+    Attributes:
+        batch_size (int): The largest number of ratings applied in one drain.
+        max_pending (int): The queue size at which submissions start to wait.
+    """
+
+    def __init__(self, batch_size: int = 1000, max_pending: int = 10_000):
+        self.batch_size: int = batch_size
+        self.max_pending: int = max_pending
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def __aenter__(self) -> 'AsyncRatingService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """
+        Start the background writer on the running event loop.
+        """
+        if self._worker is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._worker = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        """
+        Apply every queued rating and stop the background writer.
+        """
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _submit(self, rater, person, course: str, grades: list,
+                      timestamp: float | None) -> str | None:
+        if self._worker is None:
+            raise RuntimeError('The rating service is not started.')
+        timestamp = time.time() if timestamp is None else timestamp
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((rater, person, course, grades, timestamp, future))
+        return await future
+
+    async def rate_student(self, reviewer: 'Reviewer', student: 'Student', course: str,
+                           grade: list, timestamp: float = None) -> str | None:
+        """
+        Queue grades from a reviewer for a student.
+
+        The grades are stamped with timestamp, or with the time of submission rather than
+        the time the batch is written.
+
+        Returns:
+            str: None once the grades are written, or the reason they were rejected.
+        """
+        return await self._submit(reviewer, student, course, list(grade), timestamp)
+
+    async def rate_lecturer(self, student: 'Student', lecturer: 'Lecturer', course: str,
+                            grade: int, timestamp: float = None) -> str | None:
+        """
+        Queue a grade from a student for a lecturer, stamped like rate_student.
+
+        Returns:
+            str: None once the grade is written, or the reason it was rejected.
+        """
+        return await self._submit(student, lecturer, course, [grade], timestamp)
+
+    async def flush(self) -> None:
+        """
+        Wait until every rating queued so far is written.
+        """
+        if self._worker is not None:
+            await self._queue.join()
+
+    async def average_rating(self, course_name: str, role: str = 'students',
+                             consistent: bool = True) -> float:
+        """
+        Return the average of a course from the course index.
+
+        Parameters:
+            course_name (str): The course to look up.
+            role (str): Either 'students' or 'lecturers'.
+            consistent (bool): Wait for queued ratings to be written first.
+
+        Returns:
+            float: The average rounded to one decimal place, or 'Еще нет оценок'.
+        """
+        if consistent:
+            await self.flush()
+        return course_index.average(course_name, role)
+
+    async def _drain(self) -> None:
+        while True:
+            batch: list[tuple] = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                self._apply(batch)
+            except Exception as error:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _apply(batch: list[tuple]) -> None:
+        by_rater: dict[int, tuple] = {}
+        for rater, person, course, grades, timestamp, future in batch:
+            rater_rows: tuple = by_rater.setdefault(id(rater), (rater, [], []))
+            rater_rows[1].append((person, course, grades, timestamp))
+            rater_rows[2].append(future)
+
+        for rater, rows, futures in by_rater.values():
+            results: list = [None] * len(rows)
+            for error in rate_rows(rater, rows):
+                results[error.row] = error.reason
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
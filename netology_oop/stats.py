@@ -0,0 +1,251 @@
+# Course-wide statistics: the course index, rankings and average_rating
+import heapq
+import itertools
+import time
+from collections.abc import Iterable
+
+from netology_oop import metrics
+from netology_oop.model import CourseRecord, GradeAggregate, GradeBook, RatingListener, Student
+
+
+# Course-level index
+class CourseIndex(RatingListener):
+    """
+    Per-course grade aggregates across all students and all lecturers.
+
+    The index listens to every GradeBook write, so the average for a course is a dictionary
+    lookup instead of a scan over every person's grades.
+
+    Attributes:
+        students (dict): A GradeAggregate of homework grades for every course.
+        lecturers (dict): A GradeAggregate of lecture grades for every course.
+    """
+
+    def __init__(self):
+        self.students: dict[str, GradeAggregate] = {}
+        self.lecturers: dict[str, GradeAggregate] = {}
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        """
+        Update the aggregate of the course with freshly written grades.
+
+        Parameters:
+            owner (Student | Lecturer): The person who received the grades.
+            course (str): The course the grades belong to.
+            grades (list): The grades that were written.
+            timestamp (float): When the grades were given.
+        """
+        table: dict = self.students if isinstance(owner, Student) else self.lecturers
+        stats: GradeAggregate = table.get(course)
+        if stats is None:
+            stats = table[course] = GradeAggregate()
+        stats.extend(grades)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Take removed grades back out of the aggregate of the course.
+        """
+        table: dict = self.students if isinstance(owner, Student) else self.lecturers
+        stats: GradeAggregate = table[course]
+        for grade in grades:
+            stats.remove(grade)
+        if not stats.count:
+            del table[course]
+
+    def restored(self, owner, course: str, record: CourseRecord) -> None:
+        """
+        Merge the record of a completed course put back after its grades were dropped.
+        """
+        table: dict = self.students if isinstance(owner, Student) else self.lecturers
+        stats: GradeAggregate = table.get(course)
+        if stats is None:
+            stats = table[course] = GradeAggregate()
+        stats.merge(record)
+
+    def average(self, course_name: str, role: str = 'students') -> float:
+        """
+        Return the average grade of a course for all students or all lecturers.
+
+        Parameters:
+            course_name (str): The course to look up.
+            role (str): Either 'students' or 'lecturers'.
+
+        Returns:
+            float: The average rounded to one decimal place, or 'Еще нет оценок'.
+        """
+        if role not in ('students', 'lecturers'):
+            raise ValueError("Role must be either 'students' or 'lecturers'.")
+        stats: GradeAggregate = getattr(self, role).get(course_name)
+        return stats.average() if stats is not None else 'Еще нет оценок'
+
+
+course_index: CourseIndex = CourseIndex().attach()
+
+
+# Ranking
+def top_k(people: Iterable, k: int) -> list:
+    """
+    Return the k people with the highest average grade, best first.
+
+    Args:
+        people (Iterable): Students or lecturers.
+        k (int): How many people to return.
+
+    Returns:
+        list: Up to k people ordered by their average grade.
+    """
+    return heapq.nlargest(k, people, key=lambda person: person.ranking_key)
+
+
+class Leaderboard(RatingListener):
+    """
+    Per-course rankings kept up to date as ratings are written.
+
+    Every rating pushes the person's new course average onto the course's heap; outdated
+    entries are skipped when the board is read and dropped when the heap grows too large.
+
+    Attributes:
+        role (type): Student or Lecturer, the kind of person being ranked.
+    """
+
+    def __init__(self, role: type = None):
+        self.role: type = Student if role is None else role
+        self._heaps: dict[str, list] = {}
+        self._versions: dict[str, dict[int, int]] = {}
+        self._sequence = itertools.count()
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float) -> None:
+        """
+        Push the new course average of a freshly rated person.
+        """
+        if isinstance(owner, self.role):
+            self.push(owner, course)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Re-rank a person whose grades were taken back.
+        """
+        if isinstance(owner, self.role):
+            self.push(owner, course)
+
+    def restored(self, owner, course: str, record: CourseRecord) -> None:
+        """
+        Rank a person whose completed course was put back.
+        """
+        if isinstance(owner, self.role):
+            self.push(owner, course)
+
+    def push(self, person, course: str) -> None:
+        """
+        Record the current course average of a person.
+
+        Parameters:
+            person (Student | Lecturer): The person whose average changed.
+            course (str): The course whose average changed.
+        """
+        stats: GradeAggregate | None = person.grades.course_stats.get(course)
+        versions: dict[int, int] = self._versions.setdefault(course, {})
+        version: int = versions.get(id(person), 0) + 1
+        versions[id(person)] = version
+        if stats is None:
+            # Every grade of the course was taken back: the older entries are now stale
+            return
+        heap: list = self._heaps.setdefault(course, [])
+        heapq.heappush(heap, (-stats.total / stats.count, next(self._sequence), version, person))
+        if len(heap) > 2 * len(versions) + 16:
+            self._compact(course)
+
+    def load(self, people: Iterable) -> 'Leaderboard':
+        """
+        Rank the grades people already have.
+
+        Returns:
+            Leaderboard: The leaderboard itself.
+        """
+        for person in people:
+            if isinstance(person, self.role):
+                for course in person.grades.course_stats:
+                    self.push(person, course)
+        return self
+
+    def _is_current(self, course: str, entry: tuple) -> bool:
+        return self._versions[course].get(id(entry[3])) == entry[2]
+
+    def _compact(self, course: str) -> None:
+        heap: list = [entry for entry in self._heaps[course] if self._is_current(course, entry)]
+        heapq.heapify(heap)
+        self._heaps[course] = heap
+
+    def top(self, course: str, k: int) -> list[tuple]:
+        """
+        Return the best k people of a course.
+
+        Parameters:
+            course (str): The course to rank.
+            k (int): How many people to return.
+
+        Returns:
+            list: Tuples of (person, average rounded to one decimal place), best first.
+        """
+        heap: list = self._heaps.get(course, [])
+        best: list = []
+        while heap and len(best) < k:
+            entry: tuple = heapq.heappop(heap)
+            if self._is_current(course, entry):
+                best.append(entry)
+        for entry in best:
+            heapq.heappush(heap, entry)
+        return [(entry[3], round(-entry[0], 1)) for entry in best]
+
+
+# Counting duplicate keys in different dictionaries
+def count_unique_keys(dicts: list[dict]) -> dict:
+    """
+    Count the number of unique keys in the dictionary.
+
+    Args:
+        dicts (list): A list of dictionaries.
+
+    Returns:
+        dict: A dictionary with unique keys and their corresponding values.
+    """
+    keys_number: dict = {}
+    for dictionary in dicts:
+        for key in dictionary:
+            keys_number[key] = keys_number.get(key, 0) + 1
+    return keys_number
+
+
+# Calculating the average grade for homework for all students in a particular course
+def average_rating(course_name: str, role: list[dict], weights=None) -> float:
+    """
+    Calculate the average rating for a specific course.
+
+    GradeBooks contribute their running per-course aggregate, so no grade lists are scanned
+    or copied. Dictionaries that do not contain the course are skipped.
+
+    Args:
+        course_name (str): The name of the course to calculate the average rating for.
+        role (list): A list of dictionaries containing ratings for different courses.
+        weights (GradeWeights): Lesson, course and reviewer weights; equal weights if None.
+
+    Returns:
+        float: The average rating for the specified course.
+    """
+    recorder: metrics.Metrics | None = metrics.active
+    started: int = time.perf_counter_ns() if recorder is not None else 0
+    if weights is not None:
+        result: float = weights.average_rating(course_name, role)
+    else:
+        combined: GradeAggregate = GradeAggregate()
+        for grades in role:
+            if isinstance(grades, GradeBook):
+                if course_name in grades.course_stats:
+                    combined.merge(grades.course_stats[course_name])
+            else:
+                for grade in grades.get(course_name, ()):
+                    combined.add(grade)
+        result = combined.average()
+    if recorder is not None:
+        recorder.observe('average_rating', started)
+    return result
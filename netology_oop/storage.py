@@ -0,0 +1,291 @@
+# A binary model file of people and grade columns, and a memory-mapped reader for it
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+
+from netology_oop.columnar import widen_grade_column
+from netology_oop.model import CourseRecord, Lecturer, Reviewer, Student
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; mapped columns are then scanned in pure Python
+    np = None
+
+
+# Persistent storage
+MODEL_MAGIC: bytes = b'NOOPGRD3'
+# Magic, byte order flag, index length, people length and grade count
+MODEL_HEADER: struct.Struct = struct.Struct('<8s8sQQQ')
+
+
+def _person_record(person) -> dict:
+    record: dict = {'kind': type(person).__name__, 'name': person.name,
+                    'surname': person.surname, 'gender': person.gender}
+    if isinstance(person, Student):
+        record['courses_in_progress'] = list(person.courses_in_progress)
+        record['finished_courses'] = list(person.finished_courses)
+    else:
+        record['courses_attached'] = list(person.courses_attached)
+    if isinstance(person, (Student, Lecturer)):
+        frozen: dict[str, list] = {course: list(stats) for course, stats
+                                   in person.grades.course_stats.items()
+                                   if isinstance(stats, CourseRecord)}
+        if frozen:
+            record['frozen'] = frozen
+    return record
+
+
+def save_model(path: str, people: Iterable) -> None:
+    """
+    Write students, lecturers and reviewers with all their grades to a binary file.
+
+    The file holds a small JSON index (course names, per-course totals, the numbers of the
+    lecturers and the type of the grade column), a JSON block of people and four grade
+    columns: when the grade was given (float64, NaN where grade history was not recorded),
+    person number and course id (int32) and grade (int8, or the most compact wider type
+    that holds every grade). The columns are aligned so MappedGradeStore can map them
+    without copying.
+    Completed courses keep their frozen CourseRecord in the person's record, so their
+    totals survive even when the grade list was dropped.
+
+    Args:
+        path (str): The file to write.
+        people (Iterable): The people to save.
+    """
+    courses: dict[str, int] = {}
+    records: list[dict] = []
+    lecturers: list[int] = []
+    summary: dict[str, dict] = {'students': {}, 'lecturers': {}}
+    timestamp_column: array = array('d')
+    person_column: array = array('i')
+    course_column: array = array('i')
+    grade_column: array = array('b')
+    for number, person in enumerate(people):
+        records.append(_person_record(person))
+        if not isinstance(person, (Student, Lecturer)):
+            continue
+        role: str = 'students' if isinstance(person, Student) else 'lecturers'
+        if role == 'lecturers':
+            lecturers.append(number)
+        for course, grades in person.grades.items():
+            course_id: int = courses.setdefault(course, len(courses))
+            timestamp_column.extend(math.nan if timestamp is None else timestamp
+                                    for timestamp in person.grades.given_at(course))
+            person_column.extend([number] * len(grades))
+            course_column.extend([course_id] * len(grades))
+            grade_column = widen_grade_column(grade_column, grades)
+            grade_column.extend(grades)
+        for course, stats in person.grades.course_stats.items():
+            totals: list = summary[role].setdefault(course, [0, 0])
+            totals[0] += stats.total
+            totals[1] += stats.count
+
+    index: bytes = json.dumps({'courses': list(courses), 'summary': summary,
+                               'lecturers': lecturers, 'grade_type': grade_column.typecode},
+                              ensure_ascii=False).encode()
+    people_block: bytes = json.dumps(records, ensure_ascii=False).encode()
+    # Pad the JSON blocks so the float64 column starts on an 8-byte boundary
+    padding: bytes = b' ' * (-(MODEL_HEADER.size + len(index) + len(people_block)) % 8)
+    people_block += padding
+    with open(path, 'wb') as file:
+        file.write(MODEL_HEADER.pack(MODEL_MAGIC, sys.byteorder.encode(), len(index),
+                                     len(people_block), len(grade_column)))
+        file.write(index)
+        file.write(people_block)
+        timestamp_column.tofile(file)
+        person_column.tofile(file)
+        course_column.tofile(file)
+        grade_column.tofile(file)
+
+
+class MappedGradeStore:
+    """
+    A read-only, memory-mapped view of a file written by save_model.
+
+    Opening the store only parses the small index; the grade columns are memoryviews over
+    the mapped file and the people block is decoded only when it is needed.
+
+    Attributes:
+        courses (list): The course names, indexed by course id.
+        timestamp_column (memoryview): When every grade was given, as seconds since the epoch;
+        NaN if it was not recorded.
+        person_column (memoryview): The person number of every grade.
+        course_column (memoryview): The course id of every grade.
+        grade_column (memoryview): The grades, as int8 or the wider type they were saved in.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder, index_length, people_length, count = MODEL_HEADER.unpack_from(self._map)
+        if magic != MODEL_MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a saved grade model.')
+        if byteorder.rstrip(b'\0').decode() != sys.byteorder:
+            self.close()
+            raise ValueError(f'{path} was written on a machine with a different byte order.')
+
+        offset: int = MODEL_HEADER.size
+        index: dict = json.loads(self._map[offset:offset + index_length])
+        self.courses: list[str] = index['courses']
+        self._summary: dict[str, dict] = index['summary']
+        self._lecturers: list[int] = index['lecturers']
+        self._grade_type: str = index['grade_type']
+        self._course_ids: dict[str, int] = {course: i for i, course in enumerate(self.courses)}
+        self._people_span: tuple = (offset + index_length, offset + index_length + people_length)
+        self._people: list | None = None
+
+        self._columns_offset: int = self._people_span[1]
+        self.count: int = count
+        view: memoryview = memoryview(self._map)
+        start: int = self._columns_offset
+        self.timestamp_column: memoryview = view[start:start + 8 * count].cast('d')
+        self.person_column: memoryview = view[start + 8 * count:start + 12 * count].cast('i')
+        self.course_column: memoryview = view[start + 12 * count:start + 16 * count].cast('i')
+        end: int = start + (16 + array(self._grade_type).itemsize) * count
+        self.grade_column: memoryview = view[start + 16 * count:end].cast(self._grade_type)
+        view.release()
+
+    def __enter__(self) -> 'MappedGradeStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the columns and unmap the file.
+        """
+        for name in ('timestamp_column', 'person_column', 'course_column', 'grade_column'):
+            column = getattr(self, name, None)
+            if column is not None:
+                column.release()
+        self._map.close()
+        self._file.close()
+
+    @property
+    def people(self) -> list[dict]:
+        """
+        The saved person records, decoded on first access.
+        """
+        if self._people is None:
+            self._people = json.loads(self._map[slice(*self._people_span)])
+        return self._people
+
+    def average_rating(self, course_name: str, role: str = 'students') -> float:
+        """
+        Return the saved average of a course for all students or all lecturers.
+
+        Parameters:
+            course_name (str): The course to look up.
+            role (str): Either 'students' or 'lecturers'.
+
+        Returns:
+            float: The average rounded to one decimal place, or 'Еще нет оценок'.
+        """
+        totals: list = self._summary[role].get(course_name)
+        if not totals:
+            return 'Еще нет оценок'
+        return round(totals[0] / totals[1], 1)
+
+    def mean(self, course: str = None, person: int = None, role: str = None) -> float:
+        """
+        Return the mean of the mapped grades for a course and/or person number.
+
+        Without a person, the grades of one role are averaged: those of students unless
+        role says otherwise. Grades dropped when a course was completed are not in the
+        columns; average_rating still counts them.
+
+        Parameters:
+            course (str): Only grades for this course.
+            person (int): Only grades of the person with this number.
+            role (str): Either 'students' or 'lecturers'.
+
+        Raises:
+            ValueError: If role is neither 'students' nor 'lecturers'.
+        """
+        if person is None and role is None:
+            role = 'students'
+        if role not in (None, 'students', 'lecturers'):
+            raise ValueError("Role must be either 'students' or 'lecturers'.")
+        course_id: int = self._course_ids.get(course, -1) if course is not None else None
+        if np is not None:
+            offset: int = self._columns_offset
+            grades = np.frombuffer(self._map, self._grade_type, self.count,
+                                   offset + 16 * self.count)
+            mask = np.ones(self.count, dtype=bool)
+            if course_id is not None:
+                mask &= np.frombuffer(self._map, np.int32, self.count,
+                                      offset + 12 * self.count) == course_id
+            if person is not None or role is not None:
+                people = np.frombuffer(self._map, np.int32, self.count, offset + 8 * self.count)
+                if person is not None:
+                    mask &= people == person
+                if role is not None:
+                    mask &= np.isin(people, self._lecturers, invert=role == 'students')
+            selected = grades[mask]
+            total, count = selected.sum(dtype=np.float64 if self._grade_type == 'd'
+                                        else np.int64).item(), len(selected)
+        else:
+            lecturers: set[int] = set(self._lecturers)
+            total = count = 0
+            for grade, grade_person, grade_course in zip(self.grade_column, self.person_column,
+                                                         self.course_column):
+                if ((course_id is None or grade_course == course_id)
+                        and (person is None or grade_person == person)
+                        and (role is None or (grade_person in lecturers) == (role == 'lecturers'))):
+                    total += grade
+                    count += 1
+        return round(total / count, 1) if count else 'Еще нет оценок'
+
+    def load_model(self) -> list:
+        """
+        Rebuild the saved Student, Lecturer and Reviewer objects with their grades.
+
+        Grades keep the timestamps they were saved with; grades saved without one are
+        stamped with the time of loading. Rating listeners are notified as the grades are
+        added, so windows and the journal see them at their original time.
+
+        Returns:
+            list: The people in the order they were saved.
+        """
+        kinds: dict[str, type] = {'Student': Student, 'Lecturer': Lecturer, 'Reviewer': Reviewer}
+        people: list = []
+        for record in self.people:
+            person = kinds[record['kind']](record['name'], record['surname'], record['gender'])
+            if isinstance(person, Student):
+                person.courses_in_progress += record['courses_in_progress']
+                person.finished_courses += record['finished_courses']
+            else:
+                person.courses_attached += record['courses_attached']
+            people.append(person)
+
+        # Grades were written person by person, so consecutive runs share person and course;
+        # a run is split where the timestamp changes
+        start: int = 0
+        while start < self.count:
+            person_number: int = self.person_column[start]
+            course_id: int = self.course_column[start]
+            timestamp: float = self.timestamp_column[start]
+            end: int = start
+            while (end < self.count and self.person_column[end] == person_number
+                   and self.course_column[end] == course_id
+                   and (self.timestamp_column[end] == timestamp
+                        or math.isnan(timestamp) and math.isnan(self.timestamp_column[end]))):
+                end += 1
+            people[person_number].grades.add(self.courses[course_id],
+                                             self.grade_column[start:end].tolist(),
+                                             None if math.isnan(timestamp) else timestamp)
+            start = end
+
+        for person, record in zip(people, self.people):
+            for course, fields in record.get('frozen', {}).items():
+                if course in person.grades:
+                    person.grades.freeze(course)
+                else:
+                    person.grades.restore(course, CourseRecord(*fields))
+        return people
@@ -0,0 +1,114 @@
+# Weighted averages: lesson weights, course credits and reviewer weights
+from collections.abc import Iterable
+from itertools import repeat
+
+from netology_oop.model import GradeBook, Lecturer
+
+
+class GradeWeights:
+    """
+    Lesson, course credit and reviewer weights for weighted averages.
+
+    The weight of a grade is the weight of its course's credit times, for homework, the
+    weight of its lesson (its position in the course's grade list) and the weight of the
+    reviewer who gave it. Lecturer ratings are not lessons and are weighed by credit only.
+    Who gave a grade is read from the grade history (see enable_grade_history), so reviewer
+    weights apply to grades given while it is enabled. Anything without a weight, including
+    a grade whose reviewer was not recorded, weighs 1.
+
+    Averages are computed in one pass over the grade lists, with no flattened copy. When
+    every grade of a course weighs the same, the running aggregates are used and no list is
+    read at all; the same happens for completed courses whose grades were dropped.
+
+    Attributes:
+        lessons (tuple): The weight of the first, second, ... lesson of every course.
+        courses (dict): The credit weight of every course.
+    """
+
+    def __init__(self, lessons: Iterable[float] = (), courses: dict[str, float] = None,
+                 reviewers: Iterable[tuple] = ()):
+        """
+        Parameters:
+            lessons (Iterable): Lesson weights in lesson order.
+            courses (dict): Course name -> credit weight.
+            reviewers (Iterable): (reviewer, weight) pairs.
+        """
+        self.lessons: tuple[float, ...] = tuple(lessons)
+        self.courses: dict[str, float] = dict(courses or {})
+        # Keyed by id; the reviewer is held so the id is not reused
+        self._reviewers: dict[int, tuple] = {id(reviewer): (reviewer, weight)
+                                             for reviewer, weight in reviewers}
+
+    def course_weight(self, course: str) -> float:
+        """
+        Return the credit weight of a course.
+        """
+        return self.courses.get(course, 1)
+
+    def reviewer_weight(self, reviewer) -> float:
+        """
+        Return the weight of the grades given by a reviewer; 1 for None or anyone unweighted.
+        """
+        entry: tuple | None = self._reviewers.get(id(reviewer))
+        return entry[1] if entry is not None and entry[0] is reviewer else 1
+
+    def _rater_weights(self, grades: GradeBook, course: str, count: int) -> Iterable[float]:
+        # The reviewer weight of every grade of a course, in the order of its grade list
+        writes: list = grades.history(course)
+        yield from repeat(1, count - sum(write.count for write in writes))
+        for write in writes:
+            yield from repeat(self.reviewer_weight(write.rater), write.count)
+
+    def _sums(self, grades: dict, course: str) -> tuple[float, float]:
+        # The weighted sum and the sum of weights of one course of one grades dictionary
+        factor: float = self.course_weight(course)
+        homework: bool = not isinstance(getattr(grades, 'owner', None), Lecturer)
+        lessons: tuple[float, ...] = self.lessons if homework else ()
+        book: bool = isinstance(grades, GradeBook)
+        rated: bool = homework and book and bool(self._reviewers) and bool(grades.history(course))
+        stats = grades.course_stats.get(course) if book else None
+        if stats is not None and (not (lessons or rated) or course not in grades):
+            return factor * stats.total, factor * stats.count
+        course_grades = grades.get(course, ())
+        raters: Iterable[float] = (self._rater_weights(grades, course, len(course_grades))
+                                   if rated else repeat(1))
+        total: float = 0
+        weight: float = 0
+        for lesson, (grade, rater_weight) in enumerate(zip(course_grades, raters)):
+            grade_weight: float = rater_weight * (lessons[lesson] if lesson < len(lessons) else 1)
+            total += grade_weight * grade
+            weight += grade_weight
+        return factor * total, factor * weight
+
+    @staticmethod
+    def _average(total: float, weight: float) -> float:
+        if not weight:
+            return 'Еще нет оценок'
+        return round(total / weight, 1)
+
+    def person_average(self, person, course: str = None) -> float:
+        """
+        Return the weighted average of a student or a lecturer, over one or all courses.
+        """
+        grades: GradeBook = person.grades
+        total: float = 0
+        weight: float = 0
+        for name in (grades.course_stats if course is None else (course,)):
+            course_total, course_weight = self._sums(grades, name)
+            total += course_total
+            weight += course_weight
+        return self._average(total, weight)
+
+    def average_rating(self, course_name: str, role: list[dict]) -> float:
+        """
+        Return the weighted average of a course over several grades dictionaries.
+
+        This is what average_rating(course_name, role, weights) returns.
+        """
+        total: float = 0
+        weight: float = 0
+        for grades in role:
+            course_total, course_weight = self._sums(grades, course_name)
+            total += course_total
+            weight += course_weight
+        return self._average(total, weight)
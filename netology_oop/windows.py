@@ -0,0 +1,222 @@
+# Time-windowed grade aggregates: rolling and tumbling windows per person and per course
+import time
+from collections import deque
+
+from netology_oop.model import RatingListener, Student
+
+DAY: int = 24 * 60 * 60
+WEEK: int = 7 * DAY
+
+
+class RollingWindow:
+    """
+    The sum and count of the grades given during the last span seconds.
+
+    Events are kept in a deque in arrival order and expire from its left end, so every
+    event is added and removed exactly once: amortized O(1) per event. Timestamps are
+    expected to arrive in order; a late event expires together with the events around it.
+
+    Attributes:
+        span (float): The length of the window in seconds.
+        count (int): The number of grades in the window.
+        total (int): The sum of the grades in the window.
+    """
+
+    __slots__ = ('span', 'count', 'total', '_events')
+
+    def __init__(self, span: float):
+        self.span: float = span
+        self.count: int = 0
+        self.total: int = 0
+        self._events: deque = deque()
+
+    def add(self, grade: int, timestamp: float) -> None:
+        self._events.append((timestamp, grade))
+        self.count += 1
+        self.total += grade
+        self.expire(timestamp)
+
+    def remove(self, grade: int, timestamp: float) -> None:
+        """
+        Take back a grade given at timestamp if it has not expired yet.
+
+        The event is searched from the newest end of the deque, where recent grades are.
+        """
+        events: deque = self._events
+        for position in range(len(events) - 1, -1, -1):
+            if events[position] == (timestamp, grade):
+                del events[position]
+                self.count -= 1
+                self.total -= grade
+                return
+
+    def expire(self, now: float) -> None:
+        """
+        Drop the grades given span seconds or more before now.
+        """
+        cutoff: float = now - self.span
+        events: deque = self._events
+        while events and events[0][0] <= cutoff:
+            _, grade = events.popleft()
+            self.count -= 1
+            self.total -= grade
+
+    def average(self, now: float = None) -> float:
+        """
+        Return the average of the window ending at now, rounded to one decimal place.
+        """
+        self.expire(time.time() if now is None else now)
+        if not self.count:
+            return 'Еще нет оценок'
+        return round(self.total / self.count, 1)
+
+
+class TumblingWindows:
+    """
+    Sums and counts of grades in consecutive fixed windows, kept in a ring buffer.
+
+    Window number ``timestamp // width`` lives in slot ``number % keep``; a slot is reset
+    when a newer window reaches it, so only the last keep windows are remembered and every
+    update is O(1).
+
+    Attributes:
+        width (float): The length of one window in seconds.
+        keep (int): The number of windows remembered.
+    """
+
+    __slots__ = ('width', 'keep', '_numbers', '_counts', '_totals')
+
+    def __init__(self, width: float, keep: int = 12):
+        self.width: float = width
+        self.keep: int = keep
+        self._numbers: list[int | None] = [None] * keep
+        self._counts: list[int] = [0] * keep
+        self._totals: list[int] = [0] * keep
+
+    def add(self, grade: int, timestamp: float) -> None:
+        number: int = int(timestamp // self.width)
+        slot: int = number % self.keep
+        current: int | None = self._numbers[slot]
+        if current != number:
+            if current is not None and current > number:
+                # Older than every window still remembered in this slot
+                return
+            self._numbers[slot] = number
+            self._counts[slot] = 0
+            self._totals[slot] = 0
+        self._counts[slot] += 1
+        self._totals[slot] += grade
+
+    def remove(self, grade: int, timestamp: float) -> None:
+        """
+        Take back a grade given at timestamp if its window is still remembered.
+        """
+        number: int = int(timestamp // self.width)
+        slot: int = number % self.keep
+        if self._numbers[slot] == number and self._counts[slot]:
+            self._counts[slot] -= 1
+            self._totals[slot] -= grade
+
+    def windows(self, now: float = None) -> list[tuple[float, float]]:
+        """
+        Return (window start, average) for the remembered windows up to now, oldest first.
+        """
+        latest: int = int((time.time() if now is None else now) // self.width)
+        windows: list[tuple[float, float]] = []
+        for number, count, total in sorted(zip(self._numbers, self._counts, self._totals),
+                                           key=lambda window: window[0] or 0):
+            if number is not None and latest - self.keep < number <= latest and count:
+                windows.append((number * self.width, round(total / count, 1)))
+        return windows
+
+
+class WindowedGrades(RatingListener):
+    """
+    Rolling and tumbling averages for every person and every course.
+
+    Every rating is added to the windows of the rated person and to those of its course
+    for all students or all lecturers, using the timestamp the rating was given at.
+    Grades taken back later are removed from the windows they were counted in.
+
+    Attributes:
+        span (float): The length of the rolling window in seconds.
+        width (float): The length of a tumbling window in seconds.
+        keep (int): The number of tumbling windows remembered.
+    """
+
+    def __init__(self, span: float = 4 * WEEK, width: float = WEEK, keep: int = 12):
+        self.span: float = span
+        self.width: float = width
+        self.keep: int = keep
+        self._rolling: dict[tuple, RollingWindow] = {}
+        self._tumbling: dict[tuple, TumblingWindows] = {}
+        # id(person) -> person for every ('person', id) key; holding the person keeps its id
+        # from being reused by another person while its windows exist
+        self._people: dict[int, object] = {}
+
+    def __call__(self, owner, course: str, grades: list, timestamp: float | list) -> None:
+        """
+        Add freshly written grades to the windows of the person and of the course.
+        """
+        times: list = timestamp if isinstance(timestamp, list) else [timestamp] * len(grades)
+        role: str = 'students' if isinstance(owner, Student) else 'lecturers'
+        for key in (('person', id(owner)), ('course', role, course)):
+            rolling: RollingWindow = self._rolling.get(key)
+            if rolling is None:
+                rolling = self._rolling[key] = RollingWindow(self.span)
+                self._tumbling[key] = TumblingWindows(self.width, self.keep)
+                if key[0] == 'person':
+                    self._people[id(owner)] = owner
+            tumbling: TumblingWindows = self._tumbling[key]
+            for grade, given in zip(grades, times):
+                rolling.add(grade, given)
+                tumbling.add(grade, given)
+
+    def retracted(self, owner, course: str, grades: list, given_at: float) -> None:
+        """
+        Take grades given at given_at back out of the windows of the person and the course.
+        """
+        role: str = 'students' if isinstance(owner, Student) else 'lecturers'
+        for key in (('person', id(owner)), ('course', role, course)):
+            rolling: RollingWindow = self._rolling.get(key)
+            if rolling is None:
+                continue
+            tumbling: TumblingWindows = self._tumbling[key]
+            for grade in grades:
+                rolling.remove(grade, given_at)
+                tumbling.remove(grade, given_at)
+
+    @staticmethod
+    def _key(person, course: str | None, role: str) -> tuple:
+        if person is not None:
+            return 'person', id(person)
+        if course is None:
+            raise ValueError('Either a person or a course is required.')
+        return 'course', role, course
+
+    def rolling_average(self, person=None, course: str = None, role: str = 'students',
+                        now: float = None) -> float:
+        """
+        Return the average over the last span seconds for a person or a course.
+
+        Parameters:
+            person (Student | Lecturer): The person to look up.
+            course (str): The course to look up when no person is given.
+            role (str): 'students' or 'lecturers' for course lookups.
+            now (float): The end of the window; the current time by default.
+
+        Returns:
+            float: The average rounded to one decimal place, or 'Еще нет оценок'.
+        """
+        rolling: RollingWindow = self._rolling.get(self._key(person, course, role))
+        if rolling is None:
+            return 'Еще нет оценок'
+        return rolling.average(now)
+
+    def tumbling_averages(self, person=None, course: str = None, role: str = 'students',
+                          now: float = None) -> list[tuple[float, float]]:
+        """
+        Return (window start, average) for the recent fixed windows of a person or a course.
+        """
+        tumbling: TumblingWindows = self._tumbling.get(self._key(person, course, role))
+        return tumbling.windows(now) if tumbling is not None else []